@@ -0,0 +1,59 @@
+"""Store refresh token hashes as raw bytes and add a live-token user index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Convert hex text (64 chars) to the raw 32-byte SHA-256 digest
+    op.alter_column(
+        "refresh_tokens",
+        "token_hash",
+        type_=sa.LargeBinary(length=32),
+        existing_type=sa.String(length=255),
+        existing_nullable=False,
+        postgresql_using="decode(token_hash, 'hex')",
+    )
+
+    # The unique constraint already indexes every hash, and tokens are looked
+    # up by JTI (the primary key), so the separate hash index is redundant.
+    # Revoke-all only needs live tokens.
+    op.drop_index("idx_refresh_tokens_hash", table_name="refresh_tokens")
+    op.create_index(
+        "idx_refresh_tokens_user_active",
+        "refresh_tokens",
+        ["user_id"],
+        unique=False,
+        postgresql_where=sa.text("revoked = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_refresh_tokens_user_active", table_name="refresh_tokens")
+    op.create_index(
+        "idx_refresh_tokens_hash", "refresh_tokens", ["token_hash"], unique=False
+    )
+
+    op.alter_column(
+        "refresh_tokens",
+        "token_hash",
+        type_=sa.String(length=255),
+        existing_type=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using="encode(token_hash, 'hex')",
+    )
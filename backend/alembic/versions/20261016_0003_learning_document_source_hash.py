@@ -0,0 +1,39 @@
+"""Add source_hash to learning_documents for content reuse
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Existing documents stay unhashed and are simply never reused
+    op.add_column(
+        "learning_documents",
+        sa.Column("source_hash", sa.LargeBinary(length=32), nullable=True),
+    )
+    op.create_index(
+        "idx_learning_documents_source_hash",
+        "learning_documents",
+        ["source_hash"],
+        unique=False,
+        postgresql_where=sa.text("source_hash IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_learning_documents_source_hash", table_name="learning_documents")
+    op.drop_column("learning_documents", "source_hash")
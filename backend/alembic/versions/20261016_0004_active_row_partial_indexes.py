@@ -0,0 +1,35 @@
+"""Add partial index for active projects
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Project list: WHERE user_id = ? AND active ORDER BY last_activity_at DESC
+    # (a backward scan of the index serves the DESC ordering)
+    op.create_index(
+        "idx_projects_user_active",
+        "projects",
+        ["user_id", "last_activity_at"],
+        unique=False,
+        postgresql_where=sa.text("deletion_status = 'active'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_projects_user_active", table_name="projects")
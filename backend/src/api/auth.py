@@ -34,7 +34,7 @@ from src.api.schemas import (
 from src.db.session import get_session
 from src.models.user import User
 from src.services.auth.token_service import TokenService
-from src.services.auth.user_service import UserService
+from src.services.auth.user_service import EmailAlreadyRegisteredError, UserService
 
 router = APIRouter()
 
@@ -83,19 +83,18 @@ async def register(
     user_service = UserService(db)
     token_service = TokenService(db)
 
-    # Check if email already exists
-    existing_user = await user_service.get_user_by_email(request.email)
-    if existing_user:
+    # Create user (register commits internally; the unique constraint
+    # detects duplicate emails, so no pre-check query is needed)
+    try:
+        user = await user_service.register(
+            email=request.email,
+            password=request.password,
+        )
+    except EmailAlreadyRegisteredError as e:
         raise ConflictException(
             message="Email address is already registered",
             code="EMAIL_ALREADY_EXISTS",
-        )
-
-    # Create user (register commits internally)
-    user = await user_service.register(
-        email=request.email,
-        password=request.password,
-    )
+        ) from e
 
     # Generate tokens (auto-login)
     access_token = await token_service.create_access_token(user.id)
@@ -256,21 +255,17 @@ async def refresh(
     token_service = TokenService(db)
     user_service = UserService(db)
 
-    # Verify refresh token
-    if not await token_service.verify_refresh_token(refresh_token):
-        raise AuthenticationException(
-            message="Invalid or expired refresh token",
-            code="INVALID_REFRESH_TOKEN",
-        )
-
-    # Get user ID from token
+    # Rotate tokens: verifies, revokes and issues in one step, and fails
+    # for a token that is invalid, expired, or already used (e.g. by a
+    # concurrent refresh with the same token)
     try:
-        user_id = await token_service.get_user_id_from_token(refresh_token)
+        rotated = await token_service.rotate_refresh_token_for_user(refresh_token)
     except ValueError as e:
         raise AuthenticationException(
-            message="Invalid refresh token",
+            message="Invalid or expired refresh token",
             code="INVALID_REFRESH_TOKEN",
         ) from e
+    new_refresh_token, user_id = rotated
 
     # Get user
     user = await user_service.get_user_by_id(user_id)
@@ -280,8 +275,6 @@ async def refresh(
             code="USER_NOT_FOUND",
         )
 
-    # Rotate tokens
-    new_refresh_token = await token_service.rotate_refresh_token(refresh_token)
     new_access_token = await token_service.create_access_token(user.id)
 
     # Set new cookies
@@ -25,9 +25,10 @@ Usage:
 
 from uuid import UUID
 
+import jwt
 from fastapi import Depends, Request
-from jose import JWTError, jwt
-from sqlalchemy import select
+from jwt import PyJWTError as JWTError
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.exceptions import AuthenticationException
@@ -121,7 +122,7 @@ async def get_current_user(
     user_id = _decode_access_token(access_token)
 
     # Query the database for the user
-    stmt = select(User).where(User.id == user_id)
+    stmt = lambda_stmt(lambda: select(User).where(User.id == user_id))
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
 
@@ -54,7 +54,7 @@ async def get_projects(
         dict: Project list response with projects and total count.
     """
     project_service = ProjectService(db)
-    projects = await project_service.get_by_user(
+    projects = await project_service.get_by_user_rows(
         current_user.id, include_trashed=include_trashed
     )
 
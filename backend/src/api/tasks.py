@@ -149,7 +149,7 @@ async def list_tasks(
         )
 
     task_service = TaskService(db)
-    tasks = await task_service.get_by_project(project_id)
+    tasks = await task_service.get_by_project_rows(project_id)
     task_responses = [TaskResponse.model_validate(t) for t in tasks]
     return TaskListResponse(tasks=task_responses, total=len(task_responses))
 
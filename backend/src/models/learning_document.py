@@ -41,8 +41,10 @@ from sqlalchemy import (
     CheckConstraint,
     ForeignKey,
     Index,
+    LargeBinary,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -67,6 +69,8 @@ class LearningDocument(Base):
         generation_completed_at: When generation finished (nullable).
         generation_error: Error message if generation failed (nullable).
         celery_task_id: Celery task ID for status tracking (nullable).
+        source_hash: SHA-256 digest of the generation prompt, set once the
+            document completes so identical uploads can reuse its content.
         created_at: Document creation timestamp (UTC, auto-set).
         updated_at: Last modification timestamp (UTC, auto-updated).
 
@@ -79,6 +83,7 @@ class LearningDocument(Base):
         - idx_learning_documents_task_id: Fast lookup by task
         - idx_learning_documents_status: Filter by generation status
         - idx_learning_documents_celery_task: Lookup by Celery task ID
+        - idx_learning_documents_source_hash: Reuse lookup (hashed rows only)
 
     JSONB Content Structure:
         {
@@ -155,6 +160,13 @@ class LearningDocument(Base):
         default=None,
     )
 
+    # Prompt digest for reusing completed content (raw 32-byte SHA-256)
+    source_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary(32),
+        nullable=True,
+        default=None,
+    )
+
     # Timestamp fields (TIMESTAMP WITH TIME ZONE for PostgreSQL)
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
@@ -182,6 +194,12 @@ class LearningDocument(Base):
         Index("idx_learning_documents_status", "generation_status"),
         # Index for Celery task lookup
         Index("idx_learning_documents_celery_task", "celery_task_id"),
+        # Index for content reuse, skipping documents without a digest
+        Index(
+            "idx_learning_documents_source_hash",
+            "source_hash",
+            postgresql_where=text("source_hash IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
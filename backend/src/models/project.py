@@ -22,14 +22,26 @@ Example:
         await session.commit()
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import TIMESTAMP, CheckConstraint, ForeignKey, Index, String, Text
+from sqlalchemy import (
+    TIMESTAMP,
+    CheckConstraint,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db import Base
 
+# How long a trashed project or task is kept before permanent deletion
+TRASH_RETENTION = timedelta(days=30)
+
 
 class Project(Base):
     """Learning project container for related tasks.
@@ -150,6 +162,13 @@ class Project(Base):
         Index("idx_projects_user_id", "user_id"),
         # Index for deletion status filtering
         Index("idx_projects_deletion_status", "deletion_status"),
+        # Partial index for listing a user's active projects by activity
+        Index(
+            "idx_projects_user_active",
+            "user_id",
+            "last_activity_at",
+            postgresql_where=text("deletion_status = 'active'"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -160,6 +179,36 @@ class Project(Base):
         """
         return f"<Project(id={self.id}, title={self.title!r})>"
 
+    @staticmethod
+    def trash_values() -> dict[str, Any]:
+        """Column values that move a project to trash.
+
+        Shared by soft_delete() and the service's conditional UPDATE so the
+        retention period is defined once (TRASH_RETENTION).
+
+        Returns:
+            dict[str, Any]: deletion_status, trashed_at and scheduled_deletion_at.
+        """
+        now = datetime.now(UTC)
+        return {
+            "deletion_status": "trashed",
+            "trashed_at": now,
+            "scheduled_deletion_at": now + TRASH_RETENTION,
+        }
+
+    @staticmethod
+    def restore_values() -> dict[str, Any]:
+        """Column values that restore a project from trash.
+
+        Returns:
+            dict[str, Any]: Active deletion_status with trash timestamps cleared.
+        """
+        return {
+            "deletion_status": "active",
+            "trashed_at": None,
+            "scheduled_deletion_at": None,
+        }
+
     def soft_delete(self) -> None:
         """Move project to trash with 30-day scheduled deletion.
 
@@ -171,12 +220,8 @@ class Project(Base):
             await session.commit()
             # Project is now in trash
         """
-        from datetime import timedelta
-
-        now = datetime.now(UTC)
-        self.deletion_status = "trashed"
-        self.trashed_at = now
-        self.scheduled_deletion_at = now + timedelta(days=30)
+        for key, value in self.trash_values().items():
+            setattr(self, key, value)
 
     def restore(self) -> None:
         """Restore project from trash.
@@ -188,9 +233,8 @@ class Project(Base):
             await session.commit()
             # Project is now active again
         """
-        self.deletion_status = "active"
-        self.trashed_at = None
-        self.scheduled_deletion_at = None
+        for key, value in self.restore_values().items():
+            setattr(self, key, value)
 
     @property
     def is_trashed(self) -> bool:
@@ -7,7 +7,7 @@ stored, never plaintext tokens.
 The model corresponds to the 'refresh_tokens' table in PostgreSQL and includes:
 - UUID primary key for distributed system compatibility
 - Foreign key to User with CASCADE delete
-- SHA-256 hashed token storage (never plaintext)
+- Raw 32-byte SHA-256 token digest storage (never plaintext)
 - Expiration timestamp for automatic token invalidation
 - Revocation tracking for logout functionality
 
@@ -17,7 +17,7 @@ Example:
     import hashlib
 
     token_value = "random_secure_token"
-    token_hash = hashlib.sha256(token_value.encode()).hexdigest()
+    token_hash = hashlib.sha256(token_value.encode()).digest()
 
     async with get_session_context() as session:
         refresh_token = RefreshToken(
@@ -32,7 +32,7 @@ Example:
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import TIMESTAMP, Boolean, ForeignKey, Index, String
+from sqlalchemy import TIMESTAMP, Boolean, ForeignKey, Index, LargeBinary, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db import Base
@@ -48,7 +48,8 @@ class RefreshToken(Base):
     Attributes:
         id: Unique identifier (UUID v4, auto-generated).
         user_id: Foreign key to User (CASCADE delete).
-        token_hash: SHA-256 hash of the token (unique, never plaintext).
+        token_hash: Raw SHA-256 digest of the token (32 bytes, unique,
+            never plaintext).
         expires_at: Token expiration timestamp (required).
         created_at: Token creation timestamp (UTC, auto-set).
         revoked: Whether token has been revoked (default: False).
@@ -62,13 +63,14 @@ class RefreshToken(Base):
 
     Indexes:
         - idx_refresh_tokens_user_id: Fast lookup by user
-        - idx_refresh_tokens_hash: Fast token verification
+        - idx_refresh_tokens_user_active: Revoke-all over live tokens
+          (partial, WHERE revoked = false)
         - idx_refresh_tokens_expires: Efficient expired token cleanup
 
     Example:
         token = RefreshToken(
             user_id=user.id,
-            token_hash="5e884898da28047d1eb85...",
+            token_hash=hashlib.sha256(token.encode()).digest(),
             expires_at=datetime.now(UTC) + timedelta(days=7)
         )
     """
@@ -87,9 +89,9 @@ class RefreshToken(Base):
         nullable=False,
     )
 
-    # Token fields
-    token_hash: Mapped[str] = mapped_column(
-        String(255),
+    # Token fields - raw SHA-256 digest (bytea), half the size of hex text
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
         unique=True,
         nullable=False,
     )
@@ -120,7 +122,12 @@ class RefreshToken(Base):
     # Table-level indexes
     __table_args__ = (
         Index("idx_refresh_tokens_user_id", "user_id"),
-        Index("idx_refresh_tokens_hash", "token_hash"),
+        # Partial index so revoke-all only scans live (non-revoked) tokens
+        Index(
+            "idx_refresh_tokens_user_active",
+            "user_id",
+            postgresql_where=text("revoked = false"),
+        ),
         Index("idx_refresh_tokens_expires", "expires_at"),
     )
 
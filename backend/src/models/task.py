@@ -25,6 +25,7 @@ Example:
 """
 
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID, uuid4
 
 from sqlalchemy import (
@@ -40,6 +41,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db import Base
+from src.models.project import TRASH_RETENTION
 
 
 class Task(Base):
@@ -210,6 +212,36 @@ class Task(Base):
         """
         return f"<Task(id={self.id}, task_number={self.task_number}, title={self.title!r})>"
 
+    @staticmethod
+    def trash_values() -> dict[str, Any]:
+        """Column values that move a task to trash.
+
+        Uses the same TRASH_RETENTION as projects, so a task and its project
+        are scheduled for deletion on the same terms.
+
+        Returns:
+            dict[str, Any]: deletion_status, trashed_at and scheduled_deletion_at.
+        """
+        now = datetime.now(UTC)
+        return {
+            "deletion_status": "trashed",
+            "trashed_at": now,
+            "scheduled_deletion_at": now + TRASH_RETENTION,
+        }
+
+    @staticmethod
+    def restore_values() -> dict[str, Any]:
+        """Column values that restore a task from trash.
+
+        Returns:
+            dict[str, Any]: Active deletion_status with trash timestamps cleared.
+        """
+        return {
+            "deletion_status": "active",
+            "trashed_at": None,
+            "scheduled_deletion_at": None,
+        }
+
     def soft_delete(self) -> None:
         """Move task to trash with 30-day scheduled deletion.
 
@@ -221,12 +253,8 @@ class Task(Base):
             await session.commit()
             # Task is now in trash
         """
-        from datetime import timedelta
-
-        now = datetime.now(UTC)
-        self.deletion_status = "trashed"
-        self.trashed_at = now
-        self.scheduled_deletion_at = now + timedelta(days=30)
+        for key, value in self.trash_values().items():
+            setattr(self, key, value)
 
     def restore(self) -> None:
         """Restore task from trash.
@@ -238,9 +266,8 @@ class Task(Base):
             await session.commit()
             # Task is now active again
         """
-        self.deletion_status = "active"
-        self.trashed_at = None
-        self.scheduled_deletion_at = None
+        for key, value in self.restore_values().items():
+            setattr(self, key, value)
 
     @property
     def is_trashed(self) -> bool:
@@ -10,7 +10,7 @@ Service Layer Benefits:
 
 Available Services:
 - ProjectService: CRUD operations for projects
-  - create, get_by_id, get_by_user, update, soft_delete
+  - create, get_by_id, get_by_user, get_by_user_rows, update, soft_delete
   - validate_ownership: Authorization check for project access
 - UserService: User authentication and management (auth subpackage)
 - TokenService: JWT token management (auth subpackage)
@@ -25,7 +25,30 @@ Available Services:
   - retry_failed_document: Retry failed generation
 """
 
-from src.services.document import DocumentGenerationService
-from src.services.project_service import ProjectService
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.services.document import DocumentGenerationService
+    from src.services.project_service import ProjectService
 
 __all__ = ["DocumentGenerationService", "ProjectService"]
+
+# Re-exports are resolved on first access (PEP 562). Importing any
+# subpackage (e.g. src.services.auth) runs this module first, and an eager
+# import here would pull in the Gemini SDK for every one of them.
+_LAZY_EXPORTS = {
+    "DocumentGenerationService": "src.services.document",
+    "ProjectService": "src.services.project_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,6 @@ This package contains services for user authentication and authorization:
 """
 
 from src.services.auth.token_service import TokenService
-from src.services.auth.user_service import UserService
+from src.services.auth.user_service import EmailAlreadyRegisteredError, UserService
 
-__all__ = ["TokenService", "UserService"]
+__all__ = ["EmailAlreadyRegisteredError", "TokenService", "UserService"]
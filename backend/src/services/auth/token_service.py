@@ -1,15 +1,17 @@
 """Token service for JWT access and refresh token management.
 
 This module provides the TokenService class which handles:
-- Access token creation and verification (stateless, 15 min expiry)
+- Access token creation and verification (stateless, 15 min expiry),
+  including batch verification for bursts of tokens
 - Refresh token creation, verification, and storage (database-backed, 7 day expiry)
 - Token rotation (issue new refresh token, revoke old)
 - Token revocation (single token or all user tokens)
 - Expired token cleanup
 
 Security Features:
-- Refresh tokens stored as SHA-256 hashes (never plaintext)
-- JTI (JWT ID) for token uniqueness
+- Refresh tokens stored as raw SHA-256 digests (never plaintext)
+- JTI (JWT ID) doubles as the refresh token row's primary key, so
+  verification and revocation are primary-key lookups with no hashing
 - Token rotation on refresh (single-use tokens)
 - Revocation support for logout
 
@@ -17,14 +19,21 @@ Architecture Notes:
 - Service Layer Pattern: Business logic separated from API layer
 - Uses async/await for non-blocking database operations
 - Relies on jwt.py utilities for JWT encoding/decoding
+- JTIs of refresh tokens revoked by this process are remembered so replays
+  are rejected without a database round-trip (the database stays the source
+  of truth for every token that is accepted)
 """
 
+import asyncio
 import hashlib
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from uuid import UUID, uuid4
 
-from jose import JWTError, jwt
-from sqlalchemy import delete, select, update
+import jwt
+from jwt import PyJWTError as JWTError
+from sqlalchemy import delete, exists, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.refresh_token import RefreshToken
@@ -35,6 +44,121 @@ from src.utils.jwt import (
     REFRESH_TOKEN_EXPIRE_DAYS,
 )
 
+# Default token lifetimes in seconds, precomputed for int NumericDate claims
+_ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_EXPIRE_SECONDS = REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+# Maximum expired refresh tokens deleted per cleanup transaction
+CLEANUP_BATCH_SIZE = 1000
+
+# JTIs of refresh tokens revoked by this process (LRU, insertion-ordered)
+REVOKED_JTI_CACHE_MAXSIZE = 10_000
+_revoked_jtis: OrderedDict[str, None] = OrderedDict()
+
+
+def _hash_token(token: str) -> bytes:
+    """Compute the SHA-256 digest under which a refresh token is stored.
+
+    Args:
+        token: JWT refresh token string.
+
+    Returns:
+        Raw 32-byte SHA-256 digest of the token.
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _jti_from_payload(payload: dict) -> UUID | None:
+    """Extract the refresh token's JWT ID from decoded claims.
+
+    The payload must come from a signature-verified decode, which is what
+    makes it safe to look the token up by JTI alone.
+
+    Args:
+        payload: Decoded JWT claims.
+
+    Returns:
+        The JTI as a UUID, or None if it is missing or malformed.
+    """
+    try:
+        return UUID(payload["jti"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _user_id_from_payload(payload: dict) -> UUID:
+    """Extract the user ID from an already-decoded JWT payload.
+
+    Args:
+        payload: Decoded JWT claims.
+
+    Returns:
+        UUID of the user from the ``sub`` claim.
+
+    Raises:
+        ValueError: If the ``sub`` claim is missing.
+    """
+    user_id_str = payload.get("sub")
+    if user_id_str is None:
+        raise ValueError("Invalid token: missing user ID")
+    return UUID(user_id_str)
+
+
+def _decode_access_payload(token: str) -> dict | None:
+    """Decode a token and return its claims if it is a valid access token.
+
+    Pure function (no shared state), so it is safe to run in a thread.
+
+    Args:
+        token: JWT access token string.
+
+    Returns:
+        Decoded claims, or None if the token is invalid, expired, or not an
+        access token.
+    """
+    try:
+        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+    except JWTError:
+        return None
+    if payload.get("type") != "access":
+        return None
+    return payload
+
+
+def _remember_revoked_jti(payload: dict) -> None:
+    """Record a revoked refresh token's JTI in the process-local cache.
+
+    Entries never need to outlive the token itself; expired tokens are
+    rejected by the JWT decode before the cache is consulted, so plain LRU
+    eviction is enough.
+
+    Args:
+        payload: Decoded (signature-verified) JWT claims.
+    """
+    jti = payload.get("jti")
+    if jti is None:
+        return
+    _revoked_jtis[jti] = None
+    _revoked_jtis.move_to_end(jti)
+    if len(_revoked_jtis) > REVOKED_JTI_CACHE_MAXSIZE:
+        _revoked_jtis.popitem(last=False)
+
+
+def _is_known_revoked(payload: dict) -> bool:
+    """Check whether a refresh token is known to have been revoked.
+
+    A miss means "unknown", not "valid" - callers must still check the
+    database.
+
+    Args:
+        payload: Decoded JWT claims.
+
+    Returns:
+        True if the token's JTI was revoked by this process.
+    """
+    jti = payload.get("jti")
+    return jti is not None and jti in _revoked_jtis
+
 
 class TokenService:
     """Service for JWT token management.
@@ -72,12 +196,13 @@ class TokenService:
         Returns:
             Encoded JWT access token string.
         """
+        now = int(time.time())
         if expires_delta is None:
-            expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-
-        now = datetime.now(UTC)
-        expire = now + expires_delta
+            expire = now + _ACCESS_TOKEN_EXPIRE_SECONDS
+        else:
+            expire = now + int(expires_delta.total_seconds())
 
+        # exp/iat as int NumericDate (RFC 7519) - no datetime conversion needed
         payload = {
             "sub": str(user_id),
             "exp": expire,
@@ -95,7 +220,7 @@ class TokenService:
         """Create a JWT refresh token for obtaining new access tokens.
 
         Refresh tokens are long-lived (default 7 days) and stored in the
-        database as SHA-256 hashes for revocation support.
+        database as SHA-256 digests for revocation support.
 
         Args:
             user_id: UUID of the user.
@@ -104,31 +229,54 @@ class TokenService:
         Returns:
             Encoded JWT refresh token string.
         """
-        if expires_delta is None:
-            expires_delta = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        token = self._add_refresh_token(user_id, expires_delta)
+        await self.db.commit()
 
-        now = datetime.now(UTC)
-        expire = now + expires_delta
+        return token
+
+    def _add_refresh_token(
+        self,
+        user_id: UUID,
+        expires_delta: timedelta | None = None,
+    ) -> str:
+        """Mint a refresh token and stage its hash in the session.
 
+        Does not commit, so callers can persist it in the same transaction
+        as other changes.
+
+        Args:
+            user_id: UUID of the user.
+            expires_delta: Optional custom expiration time.
+
+        Returns:
+            Encoded JWT refresh token string.
+        """
+        now = int(time.time())
+        if expires_delta is None:
+            expire = now + _REFRESH_TOKEN_EXPIRE_SECONDS
+        else:
+            expire = now + int(expires_delta.total_seconds())
+
+        # One random draw serves as both the JWT ID and the row primary key
+        jti = uuid4()
         payload = {
             "sub": str(user_id),
             "exp": expire,
             "iat": now,
             "type": "refresh",
-            "jti": str(uuid4()),  # Unique identifier for token uniqueness
+            "jti": str(jti),
         }
 
         token = jwt.encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
 
-        # Store hash in database
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        # Store hash in database, keyed by the JTI so lookups need no hashing
         db_token = RefreshToken(
+            id=jti,
             user_id=user_id,
-            token_hash=token_hash,
-            expires_at=expire,
+            token_hash=_hash_token(token),
+            expires_at=datetime.fromtimestamp(expire, UTC),
         )
         self.db.add(db_token)
-        await self.db.commit()
 
         return token
 
@@ -144,17 +292,36 @@ class TokenService:
         Returns:
             True if token is valid, False otherwise.
         """
-        try:
-            payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-            return payload.get("type") == "access"
-        except JWTError:
-            return False
+        return _decode_access_payload(token) is not None
+
+    async def verify_access_tokens(self, tokens: list[str]) -> list[bool]:
+        """Verify a batch of access tokens.
+
+        Same semantics as verify_access_token for each token. All tokens are
+        decoded together in a single worker thread so a burst of
+        verifications (e.g. websocket fan-in) costs one thread hop instead
+        of blocking the event loop once per token.
+
+        Args:
+            tokens: JWT access token strings.
+
+        Returns:
+            One boolean per input token, in the same order.
+        """
+        if not tokens:
+            return []
+
+        payloads = await asyncio.to_thread(
+            lambda: [_decode_access_payload(token) for token in tokens]
+        )
+        return [payload is not None for payload in payloads]
 
     async def verify_refresh_token(self, token: str) -> bool:
         """Verify if a refresh token is valid.
 
         Checks JWT signature, expiration, token type, and revocation status
-        in the database.
+        in the database. Tokens whose JTI is already known to be revoked
+        are rejected without querying the database.
 
         Args:
             token: JWT refresh token string.
@@ -164,47 +331,81 @@ class TokenService:
         """
         try:
             payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-            if payload.get("type") != "refresh":
-                return False
+        except JWTError:
+            return False
 
-            # Check database for revocation
-            token_hash = hashlib.sha256(token.encode()).hexdigest()
-            stmt = select(RefreshToken).where(RefreshToken.token_hash == token_hash)
-            result = await self.db.execute(stmt)
-            db_token = result.scalar_one_or_none()
+        if payload.get("type") != "refresh" or _is_known_revoked(payload):
+            return False
 
-            # Token must exist, not be revoked, and not be expired
-            return db_token is not None and db_token.is_valid
-        except JWTError:
+        jti = _jti_from_payload(payload)
+        if jti is None:
             return False
 
+        return await self._verify_refresh_token_by_id(jti)
+
     async def rotate_refresh_token(self, old_token: str) -> str:
         """Rotate a refresh token: revoke old, issue new.
 
+        See rotate_refresh_token_for_user, which also returns the owner.
+
+        Args:
+            old_token: Current refresh token to rotate.
+
+        Returns:
+            New refresh token string.
+
+        Raises:
+            ValueError: If old token is invalid or already revoked.
+        """
+        new_token, _ = await self.rotate_refresh_token_for_user(old_token)
+        return new_token
+
+    async def rotate_refresh_token_for_user(self, old_token: str) -> tuple[str, UUID]:
+        """Rotate a refresh token and return the new token with its owner.
+
         This implements token rotation for enhanced security.
         Each refresh token can only be used once.
 
+        The old token is decoded exactly once. Revocation is a single
+        conditional ``UPDATE ... RETURNING user_id`` that only matches
+        a live token, so verify-and-revoke is atomic, and the new token is
+        committed in the same transaction.
+
+        The owner comes from the revoked row, so callers such as the refresh
+        endpoint need no separate verify or decode step.
+
         Args:
             old_token: Current refresh token to rotate.
 
         Returns:
-            New refresh token string.
+            Tuple of the new refresh token string and the owner's user ID.
 
         Raises:
             ValueError: If old token is invalid or already revoked.
         """
-        # Verify old token
-        if not await self.verify_refresh_token(old_token):
+        try:
+            payload = jwt.decode(old_token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        except JWTError as e:
+            raise ValueError("Invalid or expired refresh token") from e
+
+        if payload.get("type") != "refresh" or _is_known_revoked(payload):
             raise ValueError("Invalid or expired refresh token")
 
-        # Extract user_id
-        user_id = await self.get_user_id_from_token(old_token)
+        jti = _jti_from_payload(payload)
+        if jti is None:
+            raise ValueError("Invalid or expired refresh token")
 
-        # Revoke old token
-        await self.revoke_refresh_token(old_token)
+        # Revoke old token only if it is still live, getting its owner back
+        user_id = await self._revoke_and_get_user(jti)
+        if user_id is None:
+            raise ValueError("Invalid or expired refresh token")
 
-        # Issue new token
-        return await self.create_refresh_token(user_id)
+        # Issue new token and commit both changes together
+        new_token = self._add_refresh_token(user_id)
+        await self.db.commit()
+        _remember_revoked_jti(payload)
+
+        return new_token, user_id
 
     async def revoke_refresh_token(self, token: str) -> None:
         """Revoke a refresh token.
@@ -215,11 +416,93 @@ class TokenService:
         Args:
             token: Refresh token to revoke.
         """
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
-        stmt = (
-            update(RefreshToken)
-            .where(RefreshToken.token_hash == token_hash)
-            .values(revoked=True, revoked_at=datetime.now(UTC))
+        # The signature must still verify (so the JTI can be trusted), but an
+        # expired token may be revoked too. Undecodable input is a no-op.
+        try:
+            payload = jwt.decode(
+                token,
+                JWT_SECRET_KEY,
+                algorithms=[JWT_ALGORITHM],
+                options={"verify_exp": False},
+            )
+        except JWTError:
+            return
+
+        jti = _jti_from_payload(payload)
+        if jti is None:
+            return
+
+        await self._revoke_refresh_token_by_id(jti)
+        _remember_revoked_jti(payload)
+
+    async def _verify_refresh_token_by_id(self, jti: UUID) -> bool:
+        """Check that a stored refresh token exists and is still usable.
+
+        Args:
+            jti: JWT ID of the refresh token (the row's primary key).
+
+        Returns:
+            True if the token exists, is not revoked, and is not expired.
+        """
+        # Token must exist, not be revoked, and not be expired - checked in SQL
+        # so no RefreshToken row is loaded into the session. lambda_stmt
+        # caches the construct; closure variables become bound parameters.
+        now = datetime.now(UTC)
+        stmt = lambda_stmt(
+            lambda: select(
+                exists().where(
+                    RefreshToken.id == jti,
+                    RefreshToken.revoked == False,  # noqa: E712
+                    RefreshToken.expires_at > now,
+                )
+            )
+        )
+        result = await self.db.execute(stmt)
+        return bool(result.scalar())
+
+    async def _revoke_and_get_user(self, jti: UUID) -> UUID | None:
+        """Revoke a live refresh token and return its owner.
+
+        Matches only tokens that are not revoked and not expired, so a
+        concurrent rotation of the same token can succeed at most once.
+        Does not commit.
+
+        Args:
+            jti: JWT ID of the refresh token (the row's primary key).
+
+        Returns:
+            The token owner's user ID, or None if no live token matched.
+        """
+        now = datetime.now(UTC)
+        stmt = lambda_stmt(
+            lambda: (
+                update(RefreshToken)
+                .where(
+                    RefreshToken.id == jti,
+                    RefreshToken.revoked == False,  # noqa: E712
+                    RefreshToken.expires_at > now,
+                )
+                .values(revoked=True, revoked_at=now)
+                .returning(RefreshToken.user_id)
+                .execution_options(synchronize_session=False)
+            )
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def _revoke_refresh_token_by_id(self, jti: UUID) -> None:
+        """Mark the refresh token with the given JTI as revoked.
+
+        Args:
+            jti: JWT ID of the refresh token (the row's primary key).
+        """
+        now = datetime.now(UTC)
+        stmt = lambda_stmt(
+            lambda: (
+                update(RefreshToken)
+                .where(RefreshToken.id == jti)
+                .values(revoked=True, revoked_at=now)
+            )
         )
         await self.db.execute(stmt)
         await self.db.commit()
@@ -235,15 +518,6 @@ class TokenService:
         Returns:
             Number of tokens revoked.
         """
-        # Count non-revoked tokens first
-        count_stmt = select(RefreshToken).where(
-            RefreshToken.user_id == user_id,
-            RefreshToken.revoked == False,  # noqa: E712
-        )
-        result = await self.db.execute(count_stmt)
-        count = len(result.scalars().all())
-
-        # Revoke all tokens
         stmt = (
             update(RefreshToken)
             .where(
@@ -251,33 +525,54 @@ class TokenService:
                 RefreshToken.revoked == False,  # noqa: E712
             )
             .values(revoked=True, revoked_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
         )
-        await self.db.execute(stmt)
+        result = await self.db.execute(stmt)
         await self.db.commit()
 
-        return count
+        # rowcount reports matched rows, so no separate COUNT query is needed
+        return result.rowcount
 
-    async def cleanup_expired_tokens(self) -> int:
+    async def cleanup_expired_tokens(self, batch_size: int = CLEANUP_BATCH_SIZE) -> int:
         """Delete expired refresh tokens from the database.
 
-        Should be run periodically to clean up storage.
+        Should be run periodically to clean up storage. Rows are deleted in
+        batches of at most ``batch_size``, each in its own short transaction,
+        so a large backlog never holds long locks on the table.
+
+        Args:
+            batch_size: Maximum number of tokens deleted per transaction.
 
         Returns:
             Number of tokens deleted.
+
+        Raises:
+            ValueError: If batch_size is less than 1.
         """
-        # Count expired tokens
-        count_stmt = select(RefreshToken).where(
-            RefreshToken.expires_at < datetime.now(UTC)
-        )
-        result = await self.db.execute(count_stmt)
-        count = len(result.scalars().all())
+        # A batch of 0 would delete nothing and never finish the loop below
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
 
-        # Delete expired tokens
-        stmt = delete(RefreshToken).where(RefreshToken.expires_at < datetime.now(UTC))
-        await self.db.execute(stmt)
-        await self.db.commit()
+        now = datetime.now(UTC)
+        total = 0
 
-        return count
+        while True:
+            expired_ids = (
+                select(RefreshToken.id)
+                .where(RefreshToken.expires_at < now)
+                .limit(batch_size)
+            )
+            stmt = (
+                delete(RefreshToken)
+                .where(RefreshToken.id.in_(expired_ids))
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.db.execute(stmt)
+            await self.db.commit()
+
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
 
     async def get_user_id_from_token(self, token: str) -> UUID:
         """Extract user ID from a JWT token.
@@ -295,9 +590,7 @@ class TokenService:
         """
         try:
             payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-            user_id_str = payload.get("sub")
-            if user_id_str is None:
-                raise ValueError("Invalid token: missing user ID")
-            return UUID(user_id_str)
         except JWTError as e:
             raise ValueError(f"Invalid token: {e}") from e
+
+        return _user_id_from_payload(payload)
@@ -7,8 +7,9 @@ This module provides the UserService class which handles:
 
 Security Features:
 - Passwords are always hashed using bcrypt (never stored in plaintext)
+- bcrypt runs in a thread pool so it never blocks the event loop
 - Error messages don't reveal whether email or password was wrong (timing attack resistant)
-- Race condition handling for duplicate email registration via IntegrityError
+- Duplicate emails detected by the unique constraint (IntegrityError), no pre-check query
 - Minimum password length enforcement (8 characters by default)
 
 Architecture Notes:
@@ -33,18 +34,28 @@ Example:
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.user import User
-from src.utils.security import hash_password, verify_password
+from src.utils.security import hash_password_async, verify_password_async
 
 # Configuration constants
 MIN_PASSWORD_LENGTH = 8
 DEFAULT_SKILL_LEVEL = "Complete Beginner"
 
 
+class EmailAlreadyRegisteredError(ValueError):
+    """Raised when registering an email that already belongs to a user.
+
+    Subclasses ValueError so existing callers that catch validation errors
+    keep working, while the API layer can map it to 409 Conflict.
+    """
+
+    pass
+
+
 class UserService:
     """Service for user registration, login, and lookup.
 
@@ -104,7 +115,8 @@ class UserService:
         Raises:
             ValueError: If email format is invalid.
             ValueError: If password is less than 8 characters.
-            ValueError: If email is already registered.
+            EmailAlreadyRegisteredError: If email is already registered
+                (a ValueError subclass).
 
         Example:
             try:
@@ -120,7 +132,8 @@ class UserService:
         Security Note:
             - Email format validated using RFC 5322 pattern
             - Password hashed with bcrypt (cost factor 12)
-            - Race condition handled via database unique constraint
+            - Uniqueness enforced solely by the database unique constraint
+              (no pre-check SELECT), which also covers concurrent signups
         """
         # Validate email format
         if not User.is_valid_email(email):
@@ -130,29 +143,24 @@ class UserService:
         if len(password) < MIN_PASSWORD_LENGTH:
             raise ValueError("Password must be at least 8 characters")
 
-        # Check for existing user (pre-check for better error messages)
-        existing_user = await self.get_user_by_email(email)
-        if existing_user:
-            raise ValueError("Email already registered")
-
         # Hash password and create user
-        password_hash = hash_password(password)
+        password_hash = await hash_password_async(password)
         user = User(
             email=email,
             password_hash=password_hash,
             skill_level=skill_level,
         )
 
-        # Save to database with race condition handling
+        # Save to database; the unique constraint rejects duplicate emails.
+        # All column defaults are Python-side and sessions are created with
+        # expire_on_commit=False, so no refresh SELECT is needed afterwards.
         try:
             self.db.add(user)
             await self.db.commit()
-            await self.db.refresh(user)
             return user
         except IntegrityError as e:
-            # Handle concurrent registration attempts
             await self.db.rollback()
-            raise ValueError("Email already registered") from e
+            raise EmailAlreadyRegisteredError("Email already registered") from e
 
     async def login(self, email: str, password: str) -> User:
         """Authenticate user with email and password.
@@ -189,13 +197,12 @@ class UserService:
             raise ValueError("Invalid email or password")
 
         # Verify password using constant-time comparison
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             raise ValueError("Invalid email or password")
 
-        # Update last login timestamp
+        # Update last login timestamp (in-memory state is already current)
         user.last_login_at = datetime.now(UTC)
         await self.db.commit()
-        await self.db.refresh(user)
 
         return user
 
@@ -215,7 +222,7 @@ class UserService:
             if user:
                 print(f"Found user: {user.id}")
         """
-        stmt = select(User).where(User.email == email)
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -236,6 +243,6 @@ class UserService:
             if user:
                 print(f"Found user: {user.email}")
         """
-        stmt = select(User).where(User.id == user_id)
+        stmt = lambda_stmt(lambda: select(User).where(User.id == user_id))
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
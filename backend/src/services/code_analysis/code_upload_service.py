@@ -26,9 +26,9 @@ Example:
     )
 """
 
+import asyncio
 from dataclasses import dataclass
-from pathlib import Path as PathLib
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -69,6 +69,20 @@ LANGUAGE_EXTENSIONS = {
 }
 
 
+def _file_extension(filename: str) -> str:
+    """Return the suffix of the last component of a POSIX-style path.
+
+    Gives the same result as ``pathlib.PurePosixPath(filename).suffix``
+    (e.g. "" for "file." or ".env") without building a Path per file.
+    """
+    name = filename.rstrip("/")
+    while name.endswith("/."):
+        name = name[:-2].rstrip("/")
+    name = name.rpartition("/")[2]
+    dot = name.rfind(".")
+    return name[dot:] if 0 < dot < len(name) - 1 else ""
+
+
 @dataclass
 class UploadResult:
     """Result of a code upload operation."""
@@ -107,32 +121,41 @@ class CodeUploadService:
         task_id: UUID,
         files: list[tuple[str, bytes]],
     ) -> UploadResult:
-        file_infos = self.storage.save_files(user_id, task_id, files)
+        # Disk writes run in a worker thread so the event loop keeps serving
+        file_infos = await asyncio.to_thread(
+            self.storage.save_files, user_id, task_id, files
+        )
+
+        contents = [content for _, content in files]
+        total_size = sum(map(len, contents))
 
-        total_size = sum(len(content) for _, content in files)
-        total_lines = 0
-        all_content = b""
+        # Every file is followed by a newline; one join copies each byte once
+        all_content = b"\n".join([*contents, b""])
 
-        for _, content in files:
-            all_content += content + b"\n"
-            total_lines += content.count(b"\n") + 1
+        # Each file counts its own newlines plus one, which is exactly the
+        # newline count of the joined buffer (one separator per file)
+        total_lines = all_content.count(b"\n")
 
-        try:
-            decoded_content = all_content.decode("utf-8", errors="replace")
-        except Exception:
-            decoded_content = ""
+        # errors="replace" never raises; invalid bytes become U+FFFD
+        decoded_content = all_content.decode("utf-8", errors="replace")
 
         first_filename = files[0][0] if files else "unknown.txt"
         lang_info = detect_language(first_filename, decoded_content)
         detected_language = lang_info.name.lower() if lang_info else None
 
         if decoded_content:
-            complexity_result = analyze_complexity(decoded_content)
+            # CPU-bound regex scans run off the event loop
+            complexity_result = await asyncio.to_thread(
+                analyze_complexity, decoded_content
+            )
             complexity_level = complexity_result.complexity_level.value.lower()
         else:
             complexity_level = "beginner"
 
+        # Assign the primary key up front so child rows can reference it
+        # without an intermediate flush; commit writes parent then children
         uploaded_code = UploadedCode(
+            id=uuid4(),
             task_id=task_id,
             detected_language=detected_language,
             complexity_level=complexity_level,
@@ -141,23 +164,22 @@ class CodeUploadService:
             upload_size_bytes=total_size,
         )
         self.db.add(uploaded_code)
-        await self.db.flush()
-
-        code_files = []
-        for i, (original_filename, content) in enumerate(files):
-            file_info = file_infos[i]
-            file_ext = PathLib(original_filename).suffix
 
-            code_file = CodeFile(
+        code_files = [
+            CodeFile(
                 uploaded_code_id=uploaded_code.id,
                 file_name=original_filename,
                 file_path=original_filename,
-                file_extension=file_ext,
+                file_extension=_file_extension(original_filename),
                 file_size_bytes=len(content),
                 storage_path=str(file_info.path),
             )
-            self.db.add(code_file)
-            code_files.append(code_file)
+            for (original_filename, content), file_info in zip(
+                files, file_infos, strict=True
+            )
+        ]
+        # One add_all lets the unit of work batch every CodeFile INSERT
+        self.db.add_all(code_files)
 
         await self.db.commit()
 
@@ -173,28 +195,35 @@ class CodeUploadService:
         code: str,
         language: str,
     ) -> UploadResult:
-        extension = LANGUAGE_EXTENSIONS.get(language.lower(), ".txt")
+        # Keys are lowercase, so a direct hit is already normalized (the
+        # common case: the frontend sends lowercase language ids)
+        if language not in LANGUAGE_EXTENSIONS:
+            language = language.lower()
+        extension = LANGUAGE_EXTENSIONS.get(language, ".txt")
         filename = f"pasted_code{extension}"
 
         content = code.encode("utf-8")
 
-        file_info = self.storage.save_file(user_id, task_id, filename, content)
+        file_info = await asyncio.to_thread(
+            self.storage.save_file, user_id, task_id, filename, content
+        )
 
         total_lines = code.count("\n") + 1
 
-        complexity_result = analyze_complexity(code)
+        complexity_result = await asyncio.to_thread(analyze_complexity, code)
         complexity_level = complexity_result.complexity_level.value.lower()
 
+        # Pre-assigned id avoids a flush (see upload_files)
         uploaded_code = UploadedCode(
+            id=uuid4(),
             task_id=task_id,
-            detected_language=language.lower(),
+            detected_language=language,
             complexity_level=complexity_level,
             total_lines=total_lines,
             total_files=1,
             upload_size_bytes=len(content),
         )
         self.db.add(uploaded_code)
-        await self.db.flush()
 
         code_file = CodeFile(
             uploaded_code_id=uploaded_code.id,
@@ -18,7 +18,10 @@ Requirements:
 - Data Model: complexity_level ('beginner', 'intermediate', 'advanced')
 """
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from typing import TypedDict
@@ -182,59 +185,165 @@ NESTING_PATTERNS: dict[str, list[str]] = {
     ],
 }
 
+# Compiled forms of the pattern tables above, built once at import so the
+# per-line loops never go through the ``re`` module's pattern cache.
+_COMMENT_RE: dict[str, dict[str, list[re.Pattern[str]]]] = {
+    lang: {kind: [re.compile(p) for p in pats] for kind, pats in groups.items()}
+    for lang, groups in COMMENT_PATTERNS.items()
+}
+
+
+def _single_line(pattern: str) -> str:
+    """Stop a per-line pattern from matching across newlines.
+
+    Used for whole-text scans under ``re.MULTILINE``: negated classes and
+    ``\\s`` are made to exclude ``\\n`` so a match stays within one line,
+    exactly as when the pattern is searched against a single split line.
+    """
+    return pattern.replace("[^", "[^\\n").replace(r"\s", r"[^\S\n]")
+
+
+def _compile_whole_text(patterns: list[str]) -> re.Pattern[str]:
+    """Combine anchored per-line patterns into one multiline alternation."""
+    body = "|".join(f"(?:{_single_line(p)})" for p in patterns) or "(?!)"
+    return re.compile(body, re.MULTILINE)
+
+
+# Whole-text scanners: one finditer yields at most one match per line,
+# because every pattern is anchored at a line start.
+_FUNCTION_RE: dict[str, re.Pattern[str]] = {
+    lang: _compile_whole_text(pats) for lang, pats in FUNCTION_PATTERNS.items()
+}
+_CLASS_RE: dict[str, re.Pattern[str]] = {
+    lang: _compile_whole_text(pats) for lang, pats in CLASS_PATTERNS.items()
+}
+
+
+# Tokens that matter for brace nesting. Strings and comments are matched
+# whole (even if unterminated) so braces inside them are skipped; a quote
+# preceded by a backslash neither opens nor closes a string.
+_BRACE_TOKEN_RE = re.compile(
+    r"""
+    //[^\n]*
+    | /\*.*?(?:\*/|\Z)
+    | (?<!\\)"(?:[^"]|(?<=\\)")*(?:"|\Z)
+    | (?<!\\)'(?:[^']|(?<=\\)')*(?:'|\Z)
+    | [{}\n]
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+
+# Results of recent analyses keyed by (content digest, language), so repeat
+# uploads of the same file or snippet skip the regex scans entirely. Keys are
+# digests rather than the content itself to avoid pinning large sources.
+ANALYSIS_CACHE_MAXSIZE = 1024
+_analysis_cache: OrderedDict[tuple[bytes, str], CodeComplexity] = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def _lookahead(name: str, patterns: list[str]) -> str:
+    """Build an optional lookahead that captures ``name`` if any pattern hits.
+
+    All patterns are anchored with ``^``, so matching at the start of a line
+    is equivalent to ``re.search`` over the whole line.
+    """
+    body = "|".join(f"(?:{p})" for p in patterns) or "(?!)"
+    return f"(?:(?=(?P<{name}>{body})))?"
+
+
+def _compile_line_scanner(lang: str) -> re.Pattern[str]:
+    """Fuse every per-line pattern for a language into one regex.
+
+    Each pattern family sits in its own optional lookahead, so a single
+    ``match`` at the start of a line reports all families that hit without
+    one alternative shadowing another. Block comment starts are not anchored
+    in every language and stay as separate searches.
+    """
+    parts = [
+        _lookahead("func", FUNCTION_PATTERNS[lang]),
+        _lookahead("cls", CLASS_PATTERNS[lang]),
+        _lookahead("comment", COMMENT_PATTERNS[lang]["line"]),
+    ]
+    return re.compile("".join(parts))
+
+
+_LINE_RE: dict[str, re.Pattern[str]] = {
+    lang: _compile_line_scanner(lang) for lang in COMMENT_PATTERNS
+}
+
+
+@dataclass(frozen=True)
+class _LineScan:
+    """Line categories plus function and class counts from one pass."""
+
+    line_counts: LineCountResult
+    function_count: int
+    class_count: int
+
+
+# Common aliases, plus every supported name mapped to itself so that
+# already-normalized input resolves with a single lookup
+_LANGUAGE_ALIASES: dict[str, str] = {
+    **{lang: lang for lang in COMMENT_PATTERNS},
+    "py": "python",
+    "python3": "python",
+    "js": "javascript",
+    "jsx": "javascript",
+    "ts": "typescript",
+    "tsx": "typescript",
+    "c++": "cpp",
+}
+
 
 def _normalize_language(language: str | None) -> str:
     """Normalize language name to lowercase standard form."""
     if not language:
         return "python"  # Default to Python
 
+    # Fast path: clean input needs no lowercased/stripped copy
+    normalized = _LANGUAGE_ALIASES.get(language)
+    if normalized is not None:
+        return normalized
+
     lang = language.lower().strip()
+    return _LANGUAGE_ALIASES.get(lang, lang)
 
-    # Handle common aliases
-    aliases = {
-        "py": "python",
-        "python3": "python",
-        "js": "javascript",
-        "jsx": "javascript",
-        "ts": "typescript",
-        "tsx": "typescript",
-        "c++": "cpp",
-    }
 
-    return aliases.get(lang, lang)
+def _split_lines(content: str) -> list[str]:
+    """Split content into lines once for every line-based metric.
 
+    Empty content has no lines at all (rather than one empty line).
+    """
+    return content.split("\n") if content else []
 
-def count_lines(content: str, language: str | None = None) -> LineCountResult:
+
+def _scan_lines(lines: list[str], lang: str) -> _LineScan:
     """
-    Count lines in code by category.
+    Categorize lines and count function/class definitions in one pass.
 
-    Categorizes lines as:
-    - code: Lines containing actual code
-    - comment: Lines that are comments (line or block)
-    - blank: Empty or whitespace-only lines
+    Every non-blank line is matched once against the language's fused
+    scanner instead of once per pattern per metric.
 
     Args:
-        content: The source code content.
-        language: Programming language for comment detection.
+        lines: Source lines from _split_lines.
+        lang: Normalized language name.
 
     Returns:
-        Dictionary with 'total', 'code', 'comment', 'blank' counts.
+        _LineScan with line counts and function/class totals.
     """
-    if not content:
-        return {"total": 0, "code": 0, "comment": 0, "blank": 0}
-
-    lang = _normalize_language(language)
-    lines = content.split("\n")
     total = len(lines)
 
     blank_count = 0
     comment_count = 0
     code_count = 0
+    function_count = 0
+    class_count = 0
 
     in_block_comment = False
-    patterns = COMMENT_PATTERNS.get(lang, COMMENT_PATTERNS["python"])
+    line_re = _LINE_RE.get(lang, _LINE_RE["python"])
+    patterns = _COMMENT_RE.get(lang, _COMMENT_RE["python"])
 
-    line_comment_patterns = [re.compile(p) for p in patterns.get("line", [])]
     block_start_patterns = patterns.get("block_start", [])
     block_end_patterns = patterns.get("block_end", [])
 
@@ -246,17 +355,23 @@ def count_lines(content: str, language: str | None = None) -> LineCountResult:
             blank_count += 1
             continue
 
+        match = line_re.match(line)
+        if match["func"] is not None:
+            function_count += 1
+        if match["cls"] is not None:
+            class_count += 1
+
         # Check for block comment state
         if in_block_comment:
             comment_count += 1
             for end_pattern in block_end_patterns:
-                if re.search(end_pattern, line):
+                if end_pattern.search(line):
                     in_block_comment = False
             continue
 
         # Check for block comment start
         for i, start_pattern in enumerate(block_start_patterns):
-            if re.search(start_pattern, line):
+            if start_pattern.search(line):
                 # Check if it ends on the same line
                 if i < len(block_end_patterns):
                     end_pattern = block_end_patterns[i]
@@ -268,10 +383,10 @@ def count_lines(content: str, language: str | None = None) -> LineCountResult:
                             # Single line docstring, treat as comment
                             comment_count += 1
                             continue
-                    if not re.search(
-                        end_pattern,
-                        line[line.index(start_pattern[0]) + 1 :]
-                        if start_pattern[0] in "/\"'"
+                    start_char = start_pattern.pattern[0]
+                    if not end_pattern.search(
+                        line[line.index(start_char) + 1 :]
+                        if start_char in "/\"'"
                         else line,
                     ):
                         in_block_comment = True
@@ -279,18 +394,41 @@ def count_lines(content: str, language: str | None = None) -> LineCountResult:
                 break
         else:
             # Check for line comments
-            is_comment = any(p.match(stripped) for p in line_comment_patterns)
-            if is_comment:
+            if match["comment"] is not None:
                 comment_count += 1
             else:
                 code_count += 1
 
-    return {
-        "total": total,
-        "code": code_count,
-        "comment": comment_count,
-        "blank": blank_count,
-    }
+    return _LineScan(
+        line_counts={
+            "total": total,
+            "code": code_count,
+            "comment": comment_count,
+            "blank": blank_count,
+        },
+        function_count=function_count,
+        class_count=class_count,
+    )
+
+
+def count_lines(content: str, language: str | None = None) -> LineCountResult:
+    """
+    Count lines in code by category.
+
+    Categorizes lines as:
+    - code: Lines containing actual code
+    - comment: Lines that are comments (line or block)
+    - blank: Empty or whitespace-only lines
+
+    Args:
+        content: The source code content.
+        language: Programming language for comment detection.
+
+    Returns:
+        Dictionary with 'total', 'code', 'comment', 'blank' counts.
+    """
+    lang = _normalize_language(language)
+    return _scan_lines(_split_lines(content), lang).line_counts
 
 
 def calculate_nesting_depth(
@@ -309,15 +447,21 @@ def calculate_nesting_depth(
     Returns:
         Dictionary with 'max_depth' and 'average_depth'.
     """
-    if not content or not content.strip():
-        return {"max_depth": 0, "average_depth": 0.0}
+    return _nesting_depth(content, _normalize_language(language))
 
-    lang = _normalize_language(language)
-    lines = content.split("\n")
+
+def _nesting_depth(
+    content: str, lang: str, lines: list[str] | None = None
+) -> NestingDepthResult:
+    """Dispatch nesting analysis, reusing pre-split lines when given."""
+    if not content or content.isspace():
+        return {"max_depth": 0, "average_depth": 0.0}
 
     if lang == "python":
         # Python uses indentation for nesting
-        return _calculate_python_nesting(lines)
+        return _calculate_python_nesting(
+            lines if lines is not None else _split_lines(content)
+        )
     else:
         # Brace-based languages
         return _calculate_brace_nesting(content)
@@ -325,112 +469,66 @@ def calculate_nesting_depth(
 
 def _calculate_python_nesting(lines: list[str]) -> NestingDepthResult:
     """Calculate nesting depth for Python based on indentation."""
-    depths = []
-    base_indent = None
+    line_count = 0
+    depth_sum = 0
+    max_depth = 0
+    base_indent = 0
 
     for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
+        body = line.lstrip()
+        if not body or body[0] == "#":
             continue
 
         # Calculate indent level
-        leading_spaces = len(line) - len(line.lstrip())
+        leading_spaces = len(line) - len(body)
 
-        # Detect indent unit (spaces per level)
-        if base_indent is None and leading_spaces > 0:
+        # Detect indent unit (spaces per level) from the first indented line
+        if not base_indent:
             base_indent = leading_spaces
 
-        if base_indent and base_indent > 0:
-            depth = leading_spaces // base_indent
-        else:
-            depth = 0
+        depth = leading_spaces // base_indent if base_indent else 0
 
-        depths.append(depth)
+        line_count += 1
+        depth_sum += depth
+        if depth > max_depth:
+            max_depth = depth
 
-    if not depths:
+    if not line_count:
         return {"max_depth": 0, "average_depth": 0.0}
 
-    max_depth = max(depths)
-    avg_depth = sum(depths) / len(depths)
+    avg_depth = depth_sum / line_count
 
     return {"max_depth": max_depth, "average_depth": round(avg_depth, 2)}
 
 
 def _calculate_brace_nesting(content: str) -> NestingDepthResult:
     """Calculate nesting depth for brace-based languages."""
-    depths = []
+    # Depth is sampled at every newline; braces inside strings and comments
+    # are consumed as part of those tokens and never counted.
+    newlines = 0
+    depth_sum = 0
+    max_depth = 0
     current_depth = 0
 
-    # Track string and comment state to avoid counting braces in strings/comments
-    in_string = False
-    string_char = None
-    in_line_comment = False
-    in_block_comment = False
-
-    i = 0
-    while i < len(content):
-        char = content[i]
-        prev_char = content[i - 1] if i > 0 else ""
-
-        # Handle newlines
-        if char == "\n":
-            in_line_comment = False
-            depths.append(current_depth)
-            i += 1
-            continue
-
-        # Skip if in line comment
-        if in_line_comment:
-            i += 1
-            continue
-
-        # Handle block comments
-        if in_block_comment:
-            if char == "*" and i + 1 < len(content) and content[i + 1] == "/":
-                in_block_comment = False
-                i += 2
-                continue
-            i += 1
-            continue
-
-        # Check for comment start
-        if not in_string:
-            if char == "/" and i + 1 < len(content):
-                next_char = content[i + 1]
-                if next_char == "/":
-                    in_line_comment = True
-                    i += 2
-                    continue
-                elif next_char == "*":
-                    in_block_comment = True
-                    i += 2
-                    continue
-
-        # Handle strings
-        if char in "\"'" and prev_char != "\\":
-            if not in_string:
-                in_string = True
-                string_char = char
-            elif char == string_char:
-                in_string = False
-                string_char = None
-            i += 1
-            continue
-
-        # Count braces if not in string/comment
-        if not in_string and not in_line_comment and not in_block_comment:
-            if char == "{":
-                current_depth += 1
-            elif char == "}":
-                current_depth = max(0, current_depth - 1)
-
-        i += 1
+    for match in _BRACE_TOKEN_RE.finditer(content):
+        text = match.group()
+        if text == "{":
+            current_depth += 1
+        elif text == "}":
+            current_depth = max(0, current_depth - 1)
+        else:
+            # Newline, or a string/comment that may span several lines
+            count = text.count("\n")
+            if count:
+                newlines += count
+                depth_sum += current_depth * count
+                if current_depth > max_depth:
+                    max_depth = current_depth
 
-    if not depths:
-        depths.append(current_depth)
+    if not newlines:
+        return {"max_depth": current_depth, "average_depth": float(current_depth)}
 
-    max_depth = max(depths) if depths else 0
-    avg_depth = sum(depths) / len(depths) if depths else 0.0
+    avg_depth = depth_sum / newlines
 
     return {"max_depth": max_depth, "average_depth": round(avg_depth, 2)}
 
@@ -457,18 +555,9 @@ def count_functions(content: str, language: str | None = None) -> int:
         return 0
 
     lang = _normalize_language(language)
-    patterns = FUNCTION_PATTERNS.get(lang, FUNCTION_PATTERNS["python"])
-
-    count = 0
-    lines = content.split("\n")
-
-    for line in lines:
-        for pattern in patterns:
-            if re.search(pattern, line):
-                count += 1
-                break  # Count each line only once
+    pattern = _FUNCTION_RE.get(lang, _FUNCTION_RE["python"])
 
-    return count
+    return sum(1 for _ in pattern.finditer(content))
 
 
 def count_classes(content: str, language: str | None = None) -> int:
@@ -492,18 +581,9 @@ def count_classes(content: str, language: str | None = None) -> int:
         return 0
 
     lang = _normalize_language(language)
-    patterns = CLASS_PATTERNS.get(lang, CLASS_PATTERNS["python"])
+    pattern = _CLASS_RE.get(lang, _CLASS_RE["python"])
 
-    count = 0
-    lines = content.split("\n")
-
-    for line in lines:
-        for pattern in patterns:
-            if re.search(pattern, line):
-                count += 1
-                break  # Count each line only once
-
-    return count
+    return sum(1 for _ in pattern.finditer(content))
 
 
 def determine_complexity_level(
@@ -588,6 +668,10 @@ def analyze_complexity(content: str, language: str | None = None) -> CodeComplex
     - Function and class counting
     - Complexity level determination
 
+    Results are memoized in a bounded LRU keyed by a digest of the content
+    and the normalized language; CodeComplexity is frozen, so cached
+    instances are safe to share.
+
     Args:
         content: The source code content to analyze.
         language: Optional programming language hint.
@@ -602,15 +686,43 @@ def analyze_complexity(content: str, language: str | None = None) -> CodeComplex
         >>> result.complexity_level
         <ComplexityLevel.BEGINNER: 'beginner'>
     """
-    # Get line counts
-    line_counts = count_lines(content, language)
+    lang = _normalize_language(language)
 
-    # Get nesting depth
-    nesting = calculate_nesting_depth(content, language)
+    # surrogatepass keeps the encoding lossless for any str, even lone
+    # surrogates, so distinct inputs never collide on an encoding error
+    digest = hashlib.blake2b(
+        content.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+    key = (digest, lang)
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+            return cached
+
+    result = _analyze(content, lang)
 
-    # Count functions and classes
-    func_count = count_functions(content, language)
-    class_count = count_classes(content, language)
+    with _analysis_cache_lock:
+        _analysis_cache[key] = result
+        if len(_analysis_cache) > ANALYSIS_CACHE_MAXSIZE:
+            _analysis_cache.popitem(last=False)
+
+    return result
+
+
+def _analyze(content: str, lang: str) -> CodeComplexity:
+    """Compute complexity metrics for content in a normalized language."""
+    # Split once; every line-based metric below shares this list
+    lines = _split_lines(content)
+
+    # Line counts plus function and class counts share a single pass
+    scan = _scan_lines(lines, lang)
+    line_counts = scan.line_counts
+    func_count = scan.function_count
+    class_count = scan.class_count
+
+    # Get nesting depth
+    nesting = _nesting_depth(content, lang, lines)
 
     # Determine complexity level
     level = determine_complexity_level(
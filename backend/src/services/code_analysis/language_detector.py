@@ -17,8 +17,11 @@ Requirements:
 - FR-021: Support content-based language guessing for paste uploads
 """
 
+import fnmatch
+import os
+import re
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
 
 from pygments.lexer import Lexer
 from pygments.lexers import (
@@ -54,19 +57,31 @@ class LanguageInfo:
         """
         Create LanguageInfo from a Pygments lexer instance.
 
+        Lexer metadata lives on the class, so one instance is shared per
+        lexer class.
+
         Args:
             lexer: A Pygments lexer instance.
 
         Returns:
             LanguageInfo with data extracted from the lexer.
         """
-        return cls(
-            name=lexer.name,
-            aliases=tuple(lexer.aliases),
-            extensions=tuple(lexer.filenames),
-            mimetypes=tuple(lexer.mimetypes) if lexer.mimetypes else (),
-            lexer_name=lexer.__class__.__name__,
-        )
+        key = (cls, type(lexer))
+        info = _interned_languages.get(key)
+        if info is None:
+            info = cls(
+                name=lexer.name,
+                aliases=tuple(lexer.aliases),
+                extensions=tuple(lexer.filenames),
+                mimetypes=tuple(lexer.mimetypes) if lexer.mimetypes else (),
+                lexer_name=lexer.__class__.__name__,
+            )
+            _interned_languages[key] = info
+        return info
+
+
+# LanguageInfo per (LanguageInfo class, lexer class), filled by from_lexer
+_interned_languages: dict[tuple[type[LanguageInfo], type[Lexer]], LanguageInfo] = {}
 
 
 # Default language for unknown/undetectable content
@@ -79,6 +94,24 @@ UNKNOWN_LANGUAGE = LanguageInfo(
 )
 
 
+def _load_supported_languages() -> tuple[LanguageInfo, ...]:
+    """Describe every lexer Pygments registers, in registry order."""
+    return tuple(
+        LanguageInfo(
+            name=name,
+            aliases=tuple(aliases),
+            extensions=tuple(patterns),
+            mimetypes=tuple(mimetypes) if mimetypes else (),
+            lexer_name=f"{name}Lexer".replace(" ", ""),
+        )
+        for name, aliases, patterns, mimetypes in get_all_lexers()
+    )
+
+
+# The lexer registry is fixed for the life of the process
+_SUPPORTED_LANGUAGES = _load_supported_languages()
+
+
 def detect_language_by_filename(filename: str) -> LanguageInfo | None:
     """
     Detect programming language based on file extension.
@@ -103,21 +136,84 @@ def detect_language_by_filename(filename: str) -> LanguageInfo | None:
     if not filename:
         return None
 
-    # Normalize the filename
-    path = Path(filename)
-    extension = path.suffix.lower()
-
-    if not extension:
+    # Pygments only matches the base name
+    basename = os.path.basename(filename)
+    if not _has_extension(basename):
         return None
 
+    return _language_for_filename(basename)
+
+
+def _has_extension(basename: str) -> bool:
+    """Whether a base name has a suffix by Path.suffix's rules.
+
+    "Makefile", ".env" and "file." have none.
+    """
+    dot = basename.rfind(".")
+    return 0 < dot < len(basename) - 1
+
+
+def _build_filename_index() -> tuple[frozenset[str], re.Pattern[str]]:
+    """Split Pygments' filename patterns into plain suffixes and the rest.
+
+    Returns the set of literal suffixes from ``*.ext`` patterns together with
+    one compiled regex covering every other pattern (``Makefile.*``,
+    ``CMakeLists.txt``, ``*.[1-9]`` ...).
+    """
+    suffixes: set[str] = set()
+    others: set[str] = set()
+    for language in _SUPPORTED_LANGUAGES:
+        for pattern in language.extensions:
+            suffix = pattern[1:]
+            if pattern.startswith("*.") and not any(c in suffix for c in "*?["):
+                suffixes.add(suffix)
+            else:
+                others.add(pattern)
+    translated = "|".join(fnmatch.translate(p) for p in sorted(others))
+    return frozenset(suffixes), re.compile(translated or r"(?!)")
+
+
+_SIMPLE_SUFFIXES, _OTHER_FILENAME_RE = _build_filename_index()
+
+
+def _language_for_filename(basename: str) -> LanguageInfo | None:
+    """Resolve a base name, sharing one lookup per set of matching suffixes.
+
+    A name that only matches plain ``*.ext`` patterns gets the same answer as
+    its longest matching suffix, so ``main.py`` and ``utils.py`` both resolve
+    through ``.py``. Names hitting any other pattern go to Pygments as-is.
+    """
+    if _OTHER_FILENAME_RE.match(basename) is None:
+        matched = [
+            basename[i:]
+            for i, char in enumerate(basename)
+            if char == "." and basename[i:] in _SIMPLE_SUFFIXES
+        ]
+        if not matched:
+            return None
+        if _OTHER_FILENAME_RE.match(matched[0]) is None:
+            return _language_for_basename(matched[0])
+    return _language_for_basename(basename)
+
+
+@lru_cache(maxsize=1024)
+def _language_for_basename(basename: str) -> LanguageInfo | None:
+    """Resolve a file base name through Pygments' filename patterns.
+
+    Matching walks every registered lexer, so results are memoized; the
+    returned LanguageInfo is frozen and safe to share.
+    """
     try:
-        # Get lexer for the filename
-        lexer = get_lexer_for_filename(filename)
+        lexer = get_lexer_for_filename(basename)
         return LanguageInfo.from_lexer(lexer)
     except ClassNotFound:
         return None
 
 
+# How much of the content is handed to Pygments' lexer heuristics
+_GUESS_SAMPLE_CHARS = 4096
+
+
 def detect_language_by_content(
     content: str, filename: str | None = None
 ) -> LanguageInfo | None:
@@ -150,22 +246,93 @@ def detect_language_by_content(
     if not content or not content.strip():
         return None
 
+    # Lexer heuristics look for shebangs, imports and keywords, which sit
+    # near the top; scoring the whole of a large file costs far more
+    sample = content[:_GUESS_SAMPLE_CHARS]
+
     try:
         # If filename is provided, try to use it as a hint
         if filename:
             try:
-                lexer = get_lexer_for_filename(filename, code=content)
+                lexer = get_lexer_for_filename(filename, code=sample)
                 return LanguageInfo.from_lexer(lexer)
             except ClassNotFound:
                 pass
 
+        # A shebang names the interpreter outright; no need to score every lexer
+        if content.startswith("#!"):
+            result = _language_for_shebang(content)
+            if result is not None:
+                return result
+
         # Fall back to pure content guessing
-        lexer = guess_lexer(content)
-        return LanguageInfo.from_lexer(lexer)
+        return _guess_language(sample)
+    except ClassNotFound:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _guess_language(sample: str) -> LanguageInfo | None:
+    """Score every lexer against a content sample, memoizing the result.
+
+    Retries and previews of an upload analyze the same text again; with the
+    sample capped at _GUESS_SAMPLE_CHARS the cache stays around 1 MB.
+    """
+    try:
+        return LanguageInfo.from_lexer(guess_lexer(sample))
     except ClassNotFound:
         return None
 
 
+# Interpreter names from "#!" lines mapped to lexer aliases
+_SHEBANG_ALIASES = {
+    "python": "python",
+    "python3": "python",
+    "pythonw": "python",
+    "python2": "python2",
+    "node": "javascript",
+    "nodejs": "javascript",
+    "ruby": "ruby",
+    "bash": "bash",
+    "sh": "bash",
+    "zsh": "bash",
+    "ksh": "bash",
+    "dash": "bash",
+    "perl": "perl",
+    "php": "php",
+    "lua": "lua",
+}
+
+# Interpreter name with an optional major version ("python3.11" -> "python", "3")
+_INTERPRETER_RE = re.compile(r"([A-Za-z]+)(\d?)")
+
+
+def _language_for_shebang(content: str) -> LanguageInfo | None:
+    """Resolve the interpreter named on a "#!" first line, if it is a known one.
+
+    Handles both direct paths (``#!/usr/bin/python3``) and ``env`` lookups
+    (``#!/usr/bin/env -S node --flag``).
+    """
+    words = content[2:].partition("\n")[0].split()
+    if not words:
+        return None
+    interpreter = os.path.basename(words[0])
+    if interpreter == "env":
+        # Skip env's own options and VAR=value assignments
+        interpreter = next(
+            (w for w in words[1:] if not w.startswith("-") and "=" not in w), ""
+        )
+        interpreter = os.path.basename(interpreter)
+
+    match = _INTERPRETER_RE.match(interpreter)
+    if match is None:
+        return None
+    name, major = match.groups()
+    # A version digit with no entry of its own ("perl6") is left to guess_lexer
+    alias = _SHEBANG_ALIASES.get(name + major)
+    return _language_for_alias(alias) if alias else None
+
+
 def detect_language(
     filename: str | None = None, content: str | None = None
 ) -> LanguageInfo:
@@ -199,8 +366,12 @@ def detect_language(
         if result:
             return result
 
-    # Try content-based detection
+    # Try content-based detection. A filename with an extension has already
+    # been run through Pygments' patterns above and cannot match as a hint;
+    # only extensionless names such as "Makefile" are worth passing on.
     if content:
+        if filename and _has_extension(os.path.basename(filename)):
+            filename = None
         result = detect_language_by_content(content, filename)
         if result:
             return result
@@ -227,18 +398,7 @@ def get_supported_languages() -> list[LanguageInfo]:
         >>> any(lang.name == "Python" for lang in languages)
         True
     """
-    languages = []
-    for name, aliases, patterns, mimetypes in get_all_lexers():
-        languages.append(
-            LanguageInfo(
-                name=name,
-                aliases=tuple(aliases),
-                extensions=tuple(patterns),
-                mimetypes=tuple(mimetypes) if mimetypes else (),
-                lexer_name=f"{name}Lexer".replace(" ", ""),
-            )
-        )
-    return languages
+    return list(_SUPPORTED_LANGUAGES)
 
 
 def get_language_by_name(name: str) -> LanguageInfo | None:
@@ -262,8 +422,14 @@ def get_language_by_name(name: str) -> LanguageInfo | None:
     if not name:
         return None
 
+    return _language_for_alias(name.lower())
+
+
+@lru_cache(maxsize=1024)
+def _language_for_alias(alias: str) -> LanguageInfo | None:
+    """Resolve a lowercase lexer alias, memoizing the registry scan."""
     try:
-        lexer = get_lexer_by_name(name.lower())
+        lexer = get_lexer_by_name(alias)
         return LanguageInfo.from_lexer(lexer)
     except ClassNotFound:
         return None
@@ -323,9 +489,9 @@ def get_extension_for_language(language_name: str) -> str | None:
 
     Example:
         >>> get_extension_for_language("python")
-        '*.py'
+        '.py'
         >>> get_extension_for_language("javascript")
-        '*.js'
+        '.js'
     """
     info = get_language_by_name(language_name)
     if info and info.extensions:
@@ -333,6 +499,6 @@ def get_extension_for_language(language_name: str) -> str | None:
         ext = info.extensions[0]
         # Extract just the extension if it's a pattern like "*.py"
         if ext.startswith("*."):
-            return ext
+            return ext[1:]
         return ext
     return None
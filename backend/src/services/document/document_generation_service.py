@@ -35,14 +35,16 @@ Example:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import random
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, ClassVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.learning_document import LearningDocument
@@ -62,6 +64,29 @@ from src.services.ai.prompts import (
 logger = logging.getLogger(__name__)
 
 
+def _source_hash(system_instruction: str, prompt: str) -> bytes:
+    """Digest the generation input for reusing completed documents.
+
+    Line endings and trailing whitespace are normalized first, so uploads
+    that differ only in CRLF/LF or trailing spaces share a digest. Hashing
+    the built prompt (rather than the raw code) also covers language,
+    filename, extra context and any change to the prompt templates.
+
+    Args:
+        system_instruction: System instruction sent to the AI.
+        prompt: The complete document generation prompt.
+
+    Returns:
+        bytes: Raw 32-byte SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for part in (system_instruction, prompt):
+        normalized = "\n".join(line.rstrip() for line in part.splitlines())
+        digest.update(normalized.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.digest()
+
+
 class DocumentGenerationError(Exception):
     """Base exception for document generation errors."""
 
@@ -200,7 +225,8 @@ class DocumentGenerationService:
         1. Create or get existing LearningDocument record
         2. Mark generation as started
         3. Build prompts using PromptBuilder
-        4. Call Gemini API with retry logic
+        4. Reuse content generated from identical input, or call Gemini API
+           with retry logic
         5. Parse and validate response
         6. Store content and mark as completed
 
@@ -239,56 +265,16 @@ class DocumentGenerationService:
                 task_id=task_id,
             )
 
-        # Mark generation as started
-        document.start_generation(celery_task_id)
-        await self.db.commit()
-
-        try:
-            # Build prompts
-            prompt_builder = PromptBuilder(
-                code=code,
-                language=language,
-                filename=filename,
-                additional_context=additional_context,
-                file_structure=file_structure,
-            )
-            system_instruction = prompt_builder.get_system_instruction()
-            prompt = prompt_builder.build_document_prompt()
-
-            # Generate with retry
-            content = await self._generate_with_retry(
-                system_instruction=system_instruction,
-                prompt=prompt,
-                task_id=task_id,
-            )
-
-            # Validate and store content
-            validated_content = self._validate_content(content, task_id)
-            document.complete_generation(validated_content)
-            await self.db.commit()
-
-            logger.info(
-                f"Document generation completed for task {task_id}. "
-                f"Chapters: {len(validated_content)}"
-            )
-
-            return document
-
-        except Exception as e:
-            # Mark as failed
-            error_message = str(e)
-            document.fail_generation(error_message)
-            await self.db.commit()
-
-            logger.error(f"Document generation failed for task {task_id}: {e}")
-
-            if isinstance(e, (DocumentGenerationError, DocumentValidationError)):
-                raise
-            raise DocumentGenerationError(
-                f"Generation failed: {error_message}",
-                task_id=task_id,
-                original_error=e,
-            )
+        return await self._run_generation(
+            document,
+            task_id=task_id,
+            code=code,
+            language=language,
+            filename=filename,
+            additional_context=additional_context,
+            file_structure=file_structure,
+            celery_task_id=celery_task_id,
+        )
 
     async def get_document_by_task(
         self,
@@ -334,32 +320,35 @@ class DocumentGenerationService:
             status = await service.get_generation_status(task.id)
             print(f"Status: {status['status']}")
         """
-        document = await self.get_document_by_task(task_id)
-
-        if not document:
+        # Status is polled while generating; select only the status columns
+        # instead of loading the (large) content JSON with the document
+        stmt = select(
+            LearningDocument.generation_status,
+            LearningDocument.generation_started_at,
+            LearningDocument.generation_completed_at,
+            LearningDocument.generation_error,
+        ).where(LearningDocument.task_id == task_id)
+        row = (await self.db.execute(stmt)).one_or_none()
+
+        if row is None:
             return {"status": "not_found"}
 
+        status, started_at, completed_at, error = row
         status_info = {
-            "status": document.generation_status,
-            "started_at": (
-                document.generation_started_at.isoformat()
-                if document.generation_started_at
-                else None
-            ),
-            "completed_at": (
-                document.generation_completed_at.isoformat()
-                if document.generation_completed_at
-                else None
-            ),
+            "status": status,
+            "started_at": started_at.isoformat() if started_at else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
         }
 
-        if document.is_failed:
-            status_info["error"] = document.generation_error
+        if status == "failed":
+            status_info["error"] = error
 
-        if document.is_in_progress and document.generation_started_at:
-            elapsed = (
-                datetime.now(UTC) - document.generation_started_at
-            ).total_seconds()
+        if status == "in_progress" and started_at:
+            now = datetime.now(UTC)
+            # Handle timezone-naive datetimes from SQLite
+            if started_at.tzinfo is None:
+                now = now.replace(tzinfo=None)
+            elapsed = (now - started_at).total_seconds()
             # Estimate based on 3-minute target
             estimated_remaining = max(0, 180 - elapsed)
             status_info["estimated_time_remaining"] = int(estimated_remaining)
@@ -402,25 +391,35 @@ class DocumentGenerationService:
                 language="Python"
             )
         """
-        document = await self.get_document_by_task(task_id)
-
-        if not document:
-            raise ValueError(f"No document found for task {task_id}")
+        # Reset only a failed document; the WHERE clause makes concurrent
+        # retries of the same task race-safe
+        stmt = (
+            update(LearningDocument)
+            .where(
+                LearningDocument.task_id == task_id,
+                LearningDocument.generation_status == "failed",
+            )
+            .values(
+                generation_status="pending",
+                generation_error=None,
+                generation_started_at=None,
+                generation_completed_at=None,
+            )
+            .returning(LearningDocument)
+        )
+        document = (await self.db.execute(stmt)).scalar_one_or_none()
 
-        if not document.is_failed:
+        if document is None:
+            existing = await self.get_document_by_task(task_id)
+            if not existing:
+                raise ValueError(f"No document found for task {task_id}")
             raise ValueError(
-                f"Document is not in failed state. Current status: {document.generation_status}"
+                f"Document is not in failed state. Current status: {existing.generation_status}"
             )
 
-        # Reset document status
-        document.generation_status = "pending"
-        document.generation_error = None
-        document.generation_started_at = None
-        document.generation_completed_at = None
-        await self.db.commit()
-
-        # Attempt generation again
-        return await self.generate_document(
+        # Attempt generation again; the start commit also persists the reset
+        return await self._run_generation(
+            document,
             task_id=task_id,
             code=code,
             language=language,
@@ -429,6 +428,83 @@ class DocumentGenerationService:
             file_structure=file_structure,
         )
 
+    async def _run_generation(
+        self,
+        document: LearningDocument,
+        task_id: UUID,
+        code: str,
+        language: str,
+        filename: str | None = None,
+        additional_context: str | None = None,
+        file_structure: dict[str, Any] | None = None,
+        celery_task_id: str | None = None,
+    ) -> LearningDocument:
+        """Run generation for a document that is ready to (re)start.
+
+        Shared by generate_document and retry_failed_document; see
+        generate_document for the arguments and raised errors.
+
+        Returns:
+            LearningDocument: The document with generation status and content.
+        """
+        # Mark generation as started
+        document.start_generation(celery_task_id)
+        await self.db.commit()
+
+        try:
+            # Build prompts
+            prompt_builder = PromptBuilder(
+                code=code,
+                language=language,
+                filename=filename,
+                additional_context=additional_context,
+                file_structure=file_structure,
+            )
+            system_instruction = prompt_builder.get_system_instruction()
+            prompt = prompt_builder.build_document_prompt()
+
+            # Reuse a completed document generated from the same input,
+            # otherwise generate with retry
+            source_hash = _source_hash(system_instruction, prompt)
+            content = await self._find_reusable_content(source_hash)
+            if content is not None:
+                logger.info(f"Reusing generated content for task {task_id}")
+            else:
+                content = await self._generate_with_retry(
+                    system_instruction=system_instruction,
+                    prompt=prompt,
+                    task_id=task_id,
+                )
+
+            # Validate and store content
+            validated_content = self._validate_content(content, task_id)
+            document.complete_generation(validated_content)
+            document.source_hash = source_hash
+            await self.db.commit()
+
+            logger.info(
+                f"Document generation completed for task {task_id}. "
+                f"Chapters: {len(validated_content)}"
+            )
+
+            return document
+
+        except Exception as e:
+            # Mark as failed
+            error_message = str(e)
+            document.fail_generation(error_message)
+            await self.db.commit()
+
+            logger.error(f"Document generation failed for task {task_id}: {e}")
+
+            if isinstance(e, (DocumentGenerationError, DocumentValidationError)):
+                raise
+            raise DocumentGenerationError(
+                f"Generation failed: {error_message}",
+                task_id=task_id,
+                original_error=e,
+            )
+
     async def _get_or_create_document(
         self,
         task_id: UUID,
@@ -439,39 +515,62 @@ class DocumentGenerationService:
             task_id: UUID of the task.
 
         Returns:
-            LearningDocument: Existing or newly created document.
+            LearningDocument: Existing document, or a new one added to the
+                session (not yet committed).
 
         Raises:
             ValueError: If task does not exist.
         """
-        # Check if document exists
-        document = await self.get_document_by_task(task_id)
-
-        if document:
-            return document
-
-        # Verify task exists
-        task_stmt = select(Task).where(Task.id == task_id)
-        task_result = await self.db.execute(task_stmt)
-        task = task_result.scalar_one_or_none()
+        # Check the task and its document in one round-trip
+        stmt = (
+            select(Task.id, LearningDocument)
+            .outerjoin(LearningDocument, LearningDocument.task_id == Task.id)
+            .where(Task.id == task_id)
+        )
+        row = (await self.db.execute(stmt)).one_or_none()
 
-        if not task:
+        if row is None:
             raise ValueError(f"Task {task_id} not found")
 
-        # Create new document with placeholder content
+        if row.LearningDocument is not None:
+            return row.LearningDocument
+
+        # Create new document with placeholder content. The caller's next
+        # commit inserts it; expire_on_commit=False means no refresh either.
         document = LearningDocument(
             task_id=task_id,
             content=self.PLACEHOLDER_CONTENT.copy(),
             generation_status="pending",
         )
         self.db.add(document)
-        await self.db.commit()
-        await self.db.refresh(document)
 
         logger.info(f"Created new LearningDocument for task {task_id}")
 
         return document
 
+    async def _find_reusable_content(
+        self,
+        source_hash: bytes,
+    ) -> dict[str, Any] | None:
+        """Find content of a completed document generated from the same input.
+
+        Args:
+            source_hash: Digest from _source_hash for the current prompt.
+
+        Returns:
+            dict: Content of a matching completed document, or None.
+        """
+        stmt = (
+            select(LearningDocument.content)
+            .where(
+                LearningDocument.source_hash == source_hash,
+                LearningDocument.generation_status == "completed",
+            )
+            .limit(1)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def _generate_with_retry(
         self,
         system_instruction: str,
@@ -532,48 +631,39 @@ class DocumentGenerationService:
                     f"Rate limit hit on attempt {attempt + 1}/{self.config.max_retries + 1}"
                 )
                 # Longer delay for rate limits
-                if attempt < self.config.max_retries:
-                    delay = min(
-                        self.config.base_delay * (3**attempt),
-                        self.config.max_delay,
-                    )
-                    logger.info(f"Rate limit retry in {delay:.1f}s...")
-                    await asyncio.sleep(delay)
+                growth = 3
 
             except GeminiTimeoutError as e:
                 last_error = e
                 logger.warning(
                     f"Timeout on attempt {attempt + 1}/{self.config.max_retries + 1}"
                 )
-                if attempt < self.config.max_retries:
-                    delay = self.config.base_delay * (2**attempt)
-                    logger.info(f"Timeout retry in {delay:.1f}s...")
-                    await asyncio.sleep(delay)
+                growth = 2
 
             except GeminiError as e:
                 last_error = e
                 logger.error(
                     f"Gemini error on attempt {attempt + 1}/{self.config.max_retries + 1}: {e}"
                 )
-                if attempt < self.config.max_retries:
-                    delay = self.config.base_delay * (2**attempt)
-                    await asyncio.sleep(delay)
+                growth = 2
 
             except json.JSONDecodeError as e:
                 last_error = e
                 logger.warning(
                     f"JSON parse error on attempt {attempt + 1}/{self.config.max_retries + 1}: {e}"
                 )
-                if attempt < self.config.max_retries:
-                    delay = self.config.base_delay
-                    await asyncio.sleep(delay)
+                # A fresh response is all that's needed; no backoff
+                growth = 1
 
             except Exception as e:
                 last_error = e
                 logger.error(f"Unexpected error during generation: {e}")
-                if attempt < self.config.max_retries:
-                    delay = self.config.base_delay * (2**attempt)
-                    await asyncio.sleep(delay)
+                growth = 2
+
+            if attempt < self.config.max_retries:
+                delay = self._retry_delay(attempt, growth)
+                logger.info(f"Retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
 
         raise DocumentGenerationError(
             f"Document generation failed after {self.config.max_retries + 1} attempts: {last_error}",
@@ -582,6 +672,23 @@ class DocumentGenerationService:
             retry_count=self.config.max_retries + 1,
         )
 
+    def _retry_delay(self, attempt: int, growth: int) -> float:
+        """Compute the backoff before the next generation attempt.
+
+        The delay grows by ``growth`` per attempt, is capped at max_delay,
+        and is jittered by +/-50% so that tasks failing together (e.g. on
+        a shared rate limit) don't all retry at the same moment.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed.
+            growth: Backoff multiplier per attempt (1 keeps it constant).
+
+        Returns:
+            float: Seconds to wait.
+        """
+        delay = min(self.config.base_delay * growth**attempt, self.config.max_delay)
+        return delay * random.uniform(0.5, 1.5)  # noqa: S311 - not for security
+
     def _parse_json_response(self, content: str) -> dict[str, Any]:
         """Parse JSON response from AI.
 
@@ -718,7 +825,9 @@ class DocumentGenerationService:
             if not is_valid:
                 raise ValueError(error)
         """
-        if not code or not code.strip():
+        # isspace() stops at the first visible character instead of
+        # building a stripped copy of the whole input
+        if not code or code.isspace():
             return False, "Code cannot be empty"
 
         lines = code.count("\n") + 1
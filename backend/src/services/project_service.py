@@ -23,14 +23,46 @@ Example:
             return projects
 """
 
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import String, Text, exists, insert, literal, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.project import Project
 from src.models.user import User
 
+# Columns shown in project listings (see get_by_user_rows)
+_LIST_COLUMNS = (
+    Project.id,
+    Project.title,
+    Project.description,
+    Project.created_at,
+    Project.updated_at,
+    Project.last_activity_at,
+    Project.deletion_status,
+    Project.trashed_at,
+)
+
+
+def _validated_title(title: str) -> str:
+    """Strip a project title and check it is not empty.
+
+    Args:
+        title: Title as given by the caller.
+
+    Returns:
+        str: The stripped title.
+
+    Raises:
+        ValueError: If the title is empty or only whitespace.
+    """
+    stripped = title.strip() if title else ""
+    if not stripped:
+        raise ValueError("Project title cannot be empty")
+    return stripped
+
 
 class ProjectService:
     """Service for project CRUD operations.
@@ -101,23 +133,27 @@ class ProjectService:
                 description="Learn Python fundamentals"
             )
         """
-        # Validate title
-        if not title or len(title.strip()) == 0:
-            raise ValueError("Project title cannot be empty")
-
-        # Verify user exists
-        user = await self._get_user(user_id)
-        if not user:
-            raise ValueError(f"User with id {user_id} not found")
-
-        # Create project
-        project = Project(
-            user_id=user_id,
-            title=title.strip(),
-            description=description,
+        title = _validated_title(title)
+
+        # Select the values from the user row: a missing user yields no row,
+        # so nothing is inserted and no separate lookup is needed
+        stmt = (
+            insert(Project)
+            .from_select(
+                ["user_id", "title", "description"],
+                select(
+                    User.id,
+                    literal(title, String),
+                    literal(description, Text),
+                ).where(User.id == user_id),
+            )
+            .returning(Project)
         )
+        result = await self.db.execute(stmt)
+        project = result.scalar_one_or_none()
+        if project is None:
+            raise ValueError(f"User with id {user_id} not found")
 
-        self.db.add(project)
         await self.db.commit()
         # refresh 불필요 - expire_on_commit=False이므로 객체가 이미 유효함
 
@@ -186,6 +222,39 @@ class ProjectService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_by_user_rows(
+        self,
+        user_id: UUID,
+        include_trashed: bool = False,
+    ) -> list[Row[Any]]:
+        """Get all projects for a user as plain rows for list views.
+
+        Same filtering and ordering as get_by_user, but selects only the
+        columns a project listing shows and skips ORM object loading, which
+        roughly halves the cost per row. The rows are read-only and not
+        tracked by the session; use get_by_user to modify projects.
+
+        Args:
+            user_id: UUID of the user whose projects to retrieve.
+            include_trashed: If True, include trashed projects. Default False.
+
+        Returns:
+            List of rows with attribute access to the selected columns.
+
+        Example:
+            rows = await service.get_by_user_rows(user_id)
+            projects = [ProjectResponse.from_project(r) for r in rows]
+        """
+        stmt = select(*_LIST_COLUMNS).where(Project.user_id == user_id)
+
+        if not include_trashed:
+            stmt = stmt.where(Project.deletion_status == "active")
+
+        stmt = stmt.order_by(Project.last_activity_at.desc())
+
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
     async def update(
         self,
         project_id: UUID,
@@ -216,23 +285,34 @@ class ProjectService:
                 description="Updated description"
             )
         """
-        # Get project (active only)
-        project = await self.get_by_id(project_id)
-        if not project:
-            raise ValueError(f"Project with id {project_id} not found")
+        values: dict[str, Any] = {}
 
         # Validate title if provided
         if title is not None:
-            if len(title.strip()) == 0:
-                raise ValueError("Project title cannot be empty")
-            project.title = title.strip()
+            values["title"] = _validated_title(title)
 
         # Update description (can be None to clear it)
         if description is not None:
-            project.description = description
+            values["description"] = description
+
+        if not values:
+            # Nothing to change; only confirm the project exists
+            project = await self.get_by_id(project_id)
+        else:
+            # Update the active project and read it back in one statement
+            stmt = (
+                update(Project)
+                .where(Project.id == project_id, Project.deletion_status == "active")
+                .values(**values)
+                .returning(Project)
+            )
+            result = await self.db.execute(stmt)
+            project = result.scalar_one_or_none()
+
+        if not project:
+            raise ValueError(f"Project with id {project_id} not found")
 
         await self.db.commit()
-        # refresh 불필요 - expire_on_commit=False이므로 객체가 이미 유효함
 
         return project
 
@@ -256,19 +336,24 @@ class ProjectService:
             deleted = await service.soft_delete(project.id)
             print(f"Project trashed. Scheduled deletion: {deleted.scheduled_deletion_at}")
         """
-        # Get project including trashed to check current status
-        project = await self.get_by_id(project_id, include_trashed=True)
-        if not project:
-            raise ValueError(f"Project with id {project_id} not found")
+        # Trash only an active project: the state check and the write are
+        # one conditional UPDATE, so concurrent calls cannot both succeed
+        stmt = (
+            update(Project)
+            .where(Project.id == project_id, Project.deletion_status == "active")
+            .values(**Project.trash_values())
+            .returning(Project)
+        )
+        result = await self.db.execute(stmt)
+        project = result.scalar_one_or_none()
 
-        if project.is_trashed:
+        if not project:
+            # Look the project up only to report why nothing was updated
+            if not await self.get_by_id(project_id, include_trashed=True):
+                raise ValueError(f"Project with id {project_id} not found")
             raise ValueError(f"Project with id {project_id} is already in trash")
 
-        # Use the model's soft_delete method
-        project.soft_delete()
-
         await self.db.commit()
-        # refresh 불필요 - expire_on_commit=False이므로 객체가 이미 유효함
 
         return project
 
@@ -292,17 +377,22 @@ class ProjectService:
             restored = await service.restore(project.id)
             print(f"Project restored: {restored.title}")
         """
-        # Get project including trashed to find it
-        project = await self.get_by_id(project_id, include_trashed=True)
-        if not project:
-            raise ValueError(f"Project with id {project_id} not found")
+        # Restore only a trashed project, in one conditional UPDATE
+        stmt = (
+            update(Project)
+            .where(Project.id == project_id, Project.deletion_status == "trashed")
+            .values(**Project.restore_values())
+            .returning(Project)
+        )
+        result = await self.db.execute(stmt)
+        project = result.scalar_one_or_none()
 
-        if not project.is_trashed:
+        if not project:
+            # Look the project up only to report why nothing was updated
+            if not await self.get_by_id(project_id, include_trashed=True):
+                raise ValueError(f"Project with id {project_id} not found")
             raise ValueError(f"Project with id {project_id} is not in trash")
 
-        # Use the model's restore method
-        project.restore()
-
         await self.db.commit()
 
         return project
@@ -366,20 +456,13 @@ class ProjectService:
                 # Access denied
                 raise HTTPException(status_code=403, detail="Access denied")
         """
-        project = await self.get_by_id(project_id)
-        if not project:
-            return False
-        return bool(project.user_id == user_id)
-
-    async def _get_user(self, user_id: UUID) -> User | None:
-        """Get a user by ID (internal helper).
-
-        Args:
-            user_id: UUID of the user to retrieve.
-
-        Returns:
-            User if found, None otherwise.
-        """
-        stmt = select(User).where(User.id == user_id)
+        # Let the database answer with one boolean instead of loading the row
+        stmt = select(
+            exists().where(
+                Project.id == project_id,
+                Project.user_id == user_id,
+                Project.deletion_status == "active",
+            )
+        )
         result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return bool(result.scalar())
@@ -25,9 +25,20 @@ Example:
             return tasks
 """
 
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    String,
+    Text,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -35,6 +46,37 @@ from src.models.project import Project
 from src.models.task import Task
 from src.models.uploaded_code import UploadedCode
 
+# Columns shown in task listings (see get_by_project_rows)
+_LIST_COLUMNS = (
+    Task.id,
+    Task.project_id,
+    Task.task_number,
+    Task.title,
+    Task.description,
+    Task.upload_method,
+    Task.deletion_status,
+    Task.created_at,
+    Task.updated_at,
+)
+
+
+def _validated_title(title: str) -> str:
+    """Strip a task title and check its minimum length (FR-008).
+
+    Args:
+        title: Title as given by the caller.
+
+    Returns:
+        str: The stripped title.
+
+    Raises:
+        ValueError: If the stripped title is shorter than 5 characters.
+    """
+    stripped = title.strip()
+    if len(stripped) < 5:
+        raise ValueError("Task title must be at least 5 characters")
+    return stripped
+
 
 class TaskService:
     """Service for task CRUD operations.
@@ -109,29 +151,35 @@ class TaskService:
                 description="Learn Python fundamentals"
             )
         """
-        # Validate title length
-        title = title.strip()
-        if len(title) < 5:
-            raise ValueError("Task title must be at least 5 characters")
-
-        # Verify project exists
-        project = await self._get_project(project_id)
-        if not project:
-            raise ValueError(f"Project with id {project_id} not found")
-
-        # Get next task number for this project
-        next_task_number = await self._get_next_task_number(project_id)
-
-        # Create task
-        task = Task(
-            project_id=project_id,
-            task_number=next_task_number,
-            title=title,
-            description=description,
-            upload_method=upload_method,
+        title = _validated_title(title)
+
+        # Compute the next task number inside the INSERT itself, so there is
+        # no separate MAX() round trip and no gap between reading and using it
+        next_task_number = (
+            select(func.coalesce(func.max(Task.task_number), 0) + 1)
+            .where(Task.project_id == project_id)
+            .scalar_subquery()
         )
-
-        self.db.add(task)
+        # Select the values from the project row: a missing project yields
+        # no row, so nothing is inserted and no separate lookup is needed
+        stmt = (
+            insert(Task)
+            .from_select(
+                ["project_id", "task_number", "title", "description", "upload_method"],
+                select(
+                    Project.id,
+                    next_task_number,
+                    literal(title, String),
+                    literal(description, Text),
+                    literal(upload_method, String),
+                ).where(Project.id == project_id),
+            )
+            .returning(Task)
+        )
+        result = await self.db.execute(stmt)
+        task = result.scalar_one_or_none()
+        if task is None:
+            raise ValueError(f"Project with id {project_id} not found")
         await self.db.commit()
 
         return task
@@ -238,6 +286,40 @@ class TaskService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_by_project_rows(
+        self,
+        project_id: UUID,
+        include_trashed: bool = False,
+    ) -> list[Row[Any]]:
+        """Get all tasks for a project as plain rows for list views.
+
+        Same filtering and ordering as get_by_project, but selects only the
+        columns a task listing shows and skips ORM object loading. The rows
+        are read-only and not tracked by the session; use get_by_project to
+        modify tasks.
+
+        Args:
+            project_id: UUID of the project whose tasks to retrieve.
+            include_trashed: If True, include trashed tasks. Default False.
+
+        Returns:
+            List of rows ordered by task_number, with attribute access to
+            the selected columns.
+
+        Example:
+            rows = await service.get_by_project_rows(project_id)
+            tasks = [TaskResponse.model_validate(r) for r in rows]
+        """
+        stmt = select(*_LIST_COLUMNS).where(Task.project_id == project_id)
+
+        if not include_trashed:
+            stmt = stmt.where(Task.deletion_status == "active")
+
+        stmt = stmt.order_by(Task.task_number)
+
+        result = await self.db.execute(stmt)
+        return list(result.all())
+
     async def update(
         self,
         task_id: UUID,
@@ -268,18 +350,30 @@ class TaskService:
                 description="Updated description"
             )
         """
-        task = await self.get_by_id(task_id)
-        if not task:
-            raise ValueError(f"Task with id {task_id} not found")
+        values: dict[str, Any] = {}
 
         if title is not None:
-            title = title.strip()
-            if len(title) < 5:
-                raise ValueError("Task title must be at least 5 characters")
-            task.title = title
+            values["title"] = _validated_title(title)
 
         if description is not None:
-            task.description = description
+            values["description"] = description
+
+        if not values:
+            # Nothing to change; only confirm the task exists
+            task = await self.get_by_id(task_id)
+        else:
+            # Update the active task and read it back in one statement
+            stmt = (
+                update(Task)
+                .where(Task.id == task_id, Task.deletion_status == "active")
+                .values(**values)
+                .returning(Task)
+            )
+            result = await self.db.execute(stmt)
+            task = result.scalar_one_or_none()
+
+        if not task:
+            raise ValueError(f"Task with id {task_id} not found")
 
         await self.db.commit()
 
@@ -305,14 +399,23 @@ class TaskService:
             deleted = await service.soft_delete(task.id)
             print(f"Scheduled deletion: {deleted.scheduled_deletion_at}")
         """
-        task = await self.get_by_id(task_id, include_trashed=True)
-        if not task:
-            raise ValueError(f"Task with id {task_id} not found")
+        # Trash only an active task: the state check and the write are one
+        # conditional UPDATE, so concurrent calls cannot both succeed
+        stmt = (
+            update(Task)
+            .where(Task.id == task_id, Task.deletion_status == "active")
+            .values(**Task.trash_values())
+            .returning(Task)
+        )
+        result = await self.db.execute(stmt)
+        task = result.scalar_one_or_none()
 
-        if task.is_trashed:
+        if not task:
+            # Look the task up only to report why nothing was updated
+            if not await self.get_by_id(task_id, include_trashed=True):
+                raise ValueError(f"Task with id {task_id} not found")
             raise ValueError(f"Task with id {task_id} is already in trash")
 
-        task.soft_delete()
         await self.db.commit()
 
         return task
@@ -337,14 +440,22 @@ class TaskService:
             restored = await service.restore(task.id)
             print(f"Restored: {restored.title}")
         """
-        task = await self.get_by_id(task_id, include_trashed=True)
-        if not task:
-            raise ValueError(f"Task with id {task_id} not found")
+        # Restore only a trashed task, in one conditional UPDATE
+        stmt = (
+            update(Task)
+            .where(Task.id == task_id, Task.deletion_status == "trashed")
+            .values(**Task.restore_values())
+            .returning(Task)
+        )
+        result = await self.db.execute(stmt)
+        task = result.scalar_one_or_none()
 
-        if not task.is_trashed:
+        if not task:
+            # Look the task up only to report why nothing was updated
+            if not await self.get_by_id(task_id, include_trashed=True):
+                raise ValueError(f"Task with id {task_id} not found")
             raise ValueError(f"Task with id {task_id} is not in trash")
 
-        task.restore()
         await self.db.commit()
 
         return task
@@ -370,44 +481,13 @@ class TaskService:
             if await service.validate_ownership(task_id, user.id):
                 await service.update(task_id, title="New Title")
         """
-        stmt = (
-            select(Task).options(selectinload(Task.project)).where(Task.id == task_id)
+        # One EXISTS over task and project instead of loading both objects
+        stmt = select(
+            exists().where(
+                Task.id == task_id,
+                Project.id == Task.project_id,
+                Project.user_id == user_id,
+            )
         )
         result = await self.db.execute(stmt)
-        task = result.scalar_one_or_none()
-
-        if not task:
-            return False
-
-        return bool(task.project.user_id == user_id)
-
-    async def _get_next_task_number(self, project_id: UUID) -> int:
-        """Get the next task number for a project.
-
-        Calculates the next sequential task number by finding
-        the maximum current task number and adding 1.
-
-        Args:
-            project_id: UUID of the project.
-
-        Returns:
-            int: Next task number (1 if no tasks exist).
-        """
-        stmt = select(func.max(Task.task_number)).where(Task.project_id == project_id)
-        result = await self.db.execute(stmt)
-        max_number = result.scalar()
-
-        return (max_number or 0) + 1
-
-    async def _get_project(self, project_id: UUID) -> Project | None:
-        """Get a project by ID (internal helper).
-
-        Args:
-            project_id: UUID of the project to retrieve.
-
-        Returns:
-            Project if found, None otherwise.
-        """
-        stmt = select(Project).where(Project.id == project_id)
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        return bool(result.scalar())
@@ -13,6 +13,8 @@ Configuration is loaded from environment variables:
 - CELERY_BROKER_URL: Redis URL for task queue (default: redis://localhost:6379/1)
 - CELERY_RESULT_BACKEND: Redis URL for results (default: redis://localhost:6379/2)
 - CELERY_TASK_TIME_LIMIT: Max seconds per task (default: 600 = 10 minutes)
+- CELERY_TASK_IGNORE_RESULT: Skip storing task results by default (default: false)
+- CELERY_RESULT_EXPIRES: Seconds to keep task results (default: 3600 = 1 hour)
 
 Example:
     from backend.src.tasks.celery_app import celery_app
@@ -64,6 +66,18 @@ class CeleryConfig:
         timezone: Timezone for scheduled tasks.
         task_track_started: If True, update state when task starts.
             Enables "in progress" status for long tasks.
+        task_ignore_result: If True, don't store task results by default.
+            Fire-and-forget tasks (e.g. trash cleanup) then skip the Redis
+            write; a task can still opt back in with ignore_result=False.
+        result_expires: Seconds before stored results are removed.
+            Generation status lives in the database, so results are only
+            kept long enough for a client to pick them up.
+        broker_connection_retry_on_startup: Keep retrying the broker
+            connection when a worker starts before Redis is reachable.
+        redis_health_check_interval: Seconds between Redis connection
+            health checks. Idle pooled connections dropped by a proxy or
+            load balancer are detected and replaced instead of failing
+            the next enqueue.
     """
 
     broker_url: str = "redis://localhost:6379/1"
@@ -78,6 +92,34 @@ class CeleryConfig:
     result_serializer: str = "json"
     timezone: str = "UTC"
     task_track_started: bool = True
+    task_ignore_result: bool = False
+    result_expires: int = 3600  # 1 hour
+    broker_connection_retry_on_startup: bool = True
+    redis_health_check_interval: int = 30
+
+
+def _get_positive_int(name: str, default: str) -> int:
+    """Read a positive integer setting from the environment.
+
+    Args:
+        name: Environment variable name.
+        default: Value used when the variable is not set.
+
+    Returns:
+        int: The parsed value.
+
+    Raises:
+        CeleryConfigError: If the value is not a positive integer.
+    """
+    value = os.getenv(name, default)
+    message = f"Invalid {name}: {value}. Must be a positive integer."
+    try:
+        number = int(value)
+    except ValueError as err:
+        raise CeleryConfigError(message) from err
+    if number < 1:
+        raise CeleryConfigError(message)
+    return number
 
 
 def get_celery_config() -> CeleryConfig:
@@ -89,6 +131,8 @@ def get_celery_config() -> CeleryConfig:
         CELERY_TASK_TIME_LIMIT: Max seconds per task (default: 600)
         CELERY_TASK_SOFT_TIME_LIMIT: Soft limit seconds (default: 540)
         CELERY_WORKER_PREFETCH: Prefetch multiplier (default: 1)
+        CELERY_TASK_IGNORE_RESULT: Skip storing results by default (default: false)
+        CELERY_RESULT_EXPIRES: Seconds to keep task results (default: 3600)
 
     Returns:
         CeleryConfig: Configured settings for Celery app.
@@ -100,39 +144,17 @@ def get_celery_config() -> CeleryConfig:
     result_backend = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/2")
 
     # Parse time limits with validation
-    time_limit_str = os.getenv("CELERY_TASK_TIME_LIMIT", "600")
-    soft_limit_str = os.getenv("CELERY_TASK_SOFT_TIME_LIMIT", "540")
-    prefetch_str = os.getenv("CELERY_WORKER_PREFETCH", "1")
-
-    try:
-        time_limit = int(time_limit_str)
-        if time_limit < 1:
-            raise ValueError("Time limit must be positive")
-    except ValueError as err:
-        raise CeleryConfigError(
-            f"Invalid CELERY_TASK_TIME_LIMIT: {time_limit_str}. Must be a positive integer."
-        ) from err
-
-    try:
-        soft_limit = int(soft_limit_str)
-        if soft_limit < 1:
-            raise ValueError("Soft limit must be positive")
-        if soft_limit >= time_limit:
-            # Adjust soft limit to be less than hard limit
-            soft_limit = max(1, time_limit - 60)
-    except ValueError as err:
-        raise CeleryConfigError(
-            f"Invalid CELERY_TASK_SOFT_TIME_LIMIT: {soft_limit_str}. Must be a positive integer."
-        ) from err
-
-    try:
-        prefetch = int(prefetch_str)
-        if prefetch < 1:
-            raise ValueError("Prefetch must be positive")
-    except ValueError as err:
-        raise CeleryConfigError(
-            f"Invalid CELERY_WORKER_PREFETCH: {prefetch_str}. Must be a positive integer."
-        ) from err
+    time_limit = _get_positive_int("CELERY_TASK_TIME_LIMIT", "600")
+    soft_limit = _get_positive_int("CELERY_TASK_SOFT_TIME_LIMIT", "540")
+    if soft_limit >= time_limit:
+        # Adjust soft limit to be less than hard limit
+        soft_limit = max(1, time_limit - 60)
+    prefetch = _get_positive_int("CELERY_WORKER_PREFETCH", "1")
+
+    # Result storage
+    ignore_result_env = os.getenv("CELERY_TASK_IGNORE_RESULT", "false")
+    ignore_result = ignore_result_env.lower() in ("true", "1", "yes")
+    result_expires = _get_positive_int("CELERY_RESULT_EXPIRES", "3600")
 
     return CeleryConfig(
         broker_url=broker_url,
@@ -140,6 +162,8 @@ def get_celery_config() -> CeleryConfig:
         task_time_limit=time_limit,
         task_soft_time_limit=soft_limit,
         worker_prefetch_multiplier=prefetch,
+        task_ignore_result=ignore_result,
+        result_expires=result_expires,
     )
 
 
@@ -179,6 +203,17 @@ def create_celery_app(config: CeleryConfig | None = None) -> Celery:
         result_serializer=config.result_serializer,
         timezone=config.timezone,
         task_track_started=config.task_track_started,
+        task_ignore_result=config.task_ignore_result,
+        result_expires=config.result_expires,
+        # Reuse long-lived Redis connections from the pool: keepalive and
+        # periodic health checks stop stale sockets from forcing reconnects
+        broker_connection_retry_on_startup=config.broker_connection_retry_on_startup,
+        broker_transport_options={
+            "socket_keepalive": True,
+            "health_check_interval": config.redis_health_check_interval,
+        },
+        redis_socket_keepalive=True,
+        redis_backend_health_check_interval=config.redis_health_check_interval,
     )
 
     # Configure task autodiscovery for future task modules
@@ -13,7 +13,8 @@ import os
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError as JWTError
 
 # Configuration from environment variables with defaults
 JWT_SECRET_KEY = os.environ.get(
@@ -7,9 +7,15 @@ bcrypt is chosen for password hashing because:
 - It's intentionally slow (resistant to brute-force attacks)
 - It automatically generates and stores salt with the hash
 - It supports adjustable cost factor for future-proofing
+
+Because bcrypt is intentionally slow (~100 ms at cost 12), async callers
+should use hash_password_async/verify_password_async, which run the work
+in a dedicated thread pool instead of blocking the event loop.
 """
 
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import bcrypt
 
@@ -17,6 +23,12 @@ import bcrypt
 # Cost factor: 12 = 2^12 = 4,096 iterations (good balance of security/performance)
 BCRYPT_COST_FACTOR = int(os.environ.get("BCRYPT_COST_FACTOR", "12"))
 
+# bcrypt releases the GIL while hashing, so threads give real parallelism
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt",
+)
+
 
 def hash_password(password: str) -> str:
     """
@@ -93,3 +105,38 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     except (ValueError, TypeError):
         # Invalid hash format or other errors
         return False
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+
+    Runs hash_password in the bcrypt thread pool.
+
+    Args:
+        password: The plain-text password to hash.
+
+    Returns:
+        The hashed password as a string.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash without blocking the event loop.
+
+    Runs verify_password in the bcrypt thread pool.
+
+    Args:
+        plain_password: The plain-text password to verify.
+        hashed_password: The previously hashed password to check against.
+
+    Returns:
+        True if the password matches the hash, False otherwise.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_executor, verify_password, plain_password, hashed_password
+    )
@@ -276,6 +276,39 @@ class TestRefreshEndpoint:
         assert "access_token" in data
         assert "user" in data
 
+    @pytest.mark.asyncio
+    async def test_refresh_reused_token_returns_401(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+    ):
+        """Test that a refresh token already rotated is rejected with 401."""
+        user_service = UserService(db_session)
+        await user_service.register("reuse@example.com", "Password123!")
+        await db_session.commit()
+
+        login_response = await async_client.post(
+            "/api/v1/auth/login",
+            json={
+                "email": "reuse@example.com",
+                "password": "Password123!",
+            },
+        )
+        refresh_token = login_response.cookies.get("refresh_token")
+
+        first = await async_client.post(
+            "/api/v1/auth/refresh",
+            cookies={"refresh_token": refresh_token},
+        )
+        second = await async_client.post(
+            "/api/v1/auth/refresh",
+            cookies={"refresh_token": refresh_token},
+        )
+
+        assert first.status_code == 200
+        assert second.status_code == 401
+        assert second.json()["code"] == "INVALID_REFRESH_TOKEN"
+
     @pytest.mark.asyncio
     async def test_refresh_without_token(
         self,
@@ -24,6 +24,7 @@ from src.models.user import User
 from src.services.code_analysis.code_upload_service import (
     CodeUploadService,
     UploadResult,
+    _file_extension,
 )
 from src.services.code_analysis.file_storage import FileStorageService
 
@@ -214,6 +215,27 @@ class TestCodeUploadServiceUploadFiles:
 
         assert result.uploaded_code.upload_size_bytes == 10
 
+    @pytest.mark.asyncio
+    async def test_upload_files_calculates_total_lines(
+        self,
+        upload_service: CodeUploadService,
+        user: User,
+        task: Task,
+    ) -> None:
+        """Should count each file's lines, with or without a final newline."""
+        files = [
+            ("a.py", b"x = 1\ny = 2"),  # 2 lines
+            ("b.py", b"z = 3\n"),  # 2 lines (trailing empty line)
+        ]
+
+        result = await upload_service.upload_files(
+            user_id=user.id,
+            task_id=task.id,
+            files=files,
+        )
+
+        assert result.uploaded_code.total_lines == 4
+
 
 class TestCodeUploadServiceUploadPaste:
     """Test paste code upload."""
@@ -305,6 +327,18 @@ class TestCodeUploadServiceUploadFolder:
         assert "src/utils/helper.py" in filenames
 
 
+class TestFileExtension:
+    """Test extension extraction for uploaded file paths."""
+
+    @pytest.mark.parametrize(
+        "filename",
+        ["main.py", "src/utils/helper.tsx", "Makefile", ".env", "file.", "a.b/c"],
+    )
+    def test_matches_pathlib_suffix(self, filename: str) -> None:
+        """Should agree with pathlib's suffix rules."""
+        assert _file_extension(filename) == Path(filename).suffix
+
+
 class TestUploadResult:
     """Test UploadResult dataclass."""
 
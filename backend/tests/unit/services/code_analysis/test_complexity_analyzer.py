@@ -198,6 +198,20 @@ z = x + y
 
         assert result["max_depth"] >= 3
 
+    def test_braces_in_strings_and_comments_ignored(self):
+        """Braces inside strings and comments should not affect nesting."""
+        code = """function f() {
+    const s = "{{ \\" }}";
+    // { not a block
+    /* { also
+       not a block { */
+    const c = '{';
+}
+"""
+        result = calculate_nesting_depth(code, language="javascript")
+
+        assert result["max_depth"] == 1
+
     def test_empty_content(self):
         """Should handle empty content."""
         result = calculate_nesting_depth("", language="python")
@@ -478,6 +492,18 @@ class Person {
         assert result.class_count == 0
         assert result.complexity_level == ComplexityLevel.BEGINNER
 
+    def test_repeated_content_is_cached_per_language(self):
+        """Same content and language should reuse the cached result."""
+        code = "class A {\n    void f() {\n    }\n}\n"
+
+        first = analyze_complexity(code, language="java")
+        second = analyze_complexity(code, language="java")
+        as_python = analyze_complexity(code, language="python")
+
+        assert second is first
+        assert as_python is not first
+        assert as_python.function_count == 0
+
     def test_default_language(self):
         """Should work without explicit language."""
         code = """x = 1
@@ -122,6 +122,17 @@ class TestFileStorageServiceSaveFile:
         # Should be a valid UUID format (36 chars with hyphens)
         assert len(file_info.path.stem) == 36
 
+    def test_save_file_durable_and_drop_cache(self, tmp_path: Path) -> None:
+        """Should write the same content with the durability options enabled."""
+        storage = FileStorageService(base_path=tmp_path)
+        content = b"print('hello')"
+
+        file_info = storage.save_file(
+            uuid4(), uuid4(), "test.py", content, durable=True, drop_cache=True
+        )
+
+        assert file_info.path.read_bytes() == content
+
     def test_save_file_returns_file_info(self, tmp_path: Path) -> None:
         """Should return FileInfo with original name, stored name, and path."""
         storage = FileStorageService(base_path=tmp_path)
@@ -245,6 +256,33 @@ class TestFileStorageServiceDeleteFiles:
 
         assert not storage_dir.exists()
 
+    def test_delete_files_removes_nested_directories(self, tmp_path: Path) -> None:
+        """Should also remove subdirectories inside the task directory."""
+        storage = FileStorageService(base_path=tmp_path)
+        user_id = uuid4()
+        task_id = uuid4()
+
+        storage.save_file(user_id, task_id, "test.py", b"test")
+        storage_dir = storage.get_storage_dir(user_id, task_id)
+        (storage_dir / "nested").mkdir()
+        (storage_dir / "nested" / "extra.txt").write_bytes(b"extra")
+
+        storage.delete_files(user_id, task_id)
+
+        assert not storage_dir.exists()
+
+    def test_save_after_delete_recreates_directory(self, tmp_path: Path) -> None:
+        """Should create the directory again when saving after a delete."""
+        storage = FileStorageService(base_path=tmp_path)
+        user_id = uuid4()
+        task_id = uuid4()
+
+        storage.save_file(user_id, task_id, "test.py", b"test")
+        storage.delete_files(user_id, task_id)
+        file_info = storage.save_file(user_id, task_id, "again.py", b"again")
+
+        assert file_info.path.read_bytes() == b"again"
+
     def test_delete_files_nonexistent_directory_no_error(self, tmp_path: Path) -> None:
         """Should not raise error for non-existent directory."""
         storage = FileStorageService(base_path=tmp_path)
@@ -278,3 +316,41 @@ class TestFileStorageServiceReadFile:
 
         with pytest.raises(FileNotFoundError):
             storage.read_file(user_id, task_id, "nonexistent.py")
+
+
+class TestFileStorageServiceReadFileMmap:
+    """Test read_file_mmap method."""
+
+    def test_read_file_mmap_returns_content(self, tmp_path: Path) -> None:
+        """Should expose the same bytes as read_file."""
+        storage = FileStorageService(base_path=tmp_path)
+        user_id = uuid4()
+        task_id = uuid4()
+        content = b"print('hello')"
+
+        file_info = storage.save_file(user_id, task_id, "test.py", content)
+        view = storage.read_file_mmap(user_id, task_id, file_info.stored_name)
+
+        assert bytes(view) == content
+        assert view.readonly
+        view.release()
+
+    def test_read_file_mmap_empty_file(self, tmp_path: Path) -> None:
+        """Should return an empty view for an empty file."""
+        storage = FileStorageService(base_path=tmp_path)
+        user_id = uuid4()
+        task_id = uuid4()
+
+        file_info = storage.save_file(user_id, task_id, "empty.py", b"")
+        view = storage.read_file_mmap(user_id, task_id, file_info.stored_name)
+
+        assert len(view) == 0
+
+    def test_read_file_mmap_not_found_raises_error(self, tmp_path: Path) -> None:
+        """Should raise FileNotFoundError for non-existent file."""
+        storage = FileStorageService(base_path=tmp_path)
+        user_id = uuid4()
+        task_id = uuid4()
+
+        with pytest.raises(FileNotFoundError):
+            storage.read_file_mmap(user_id, task_id, "nonexistent.py")
@@ -10,6 +10,7 @@ Tests the language detection functionality using Pygments including:
 
 import pytest
 
+from src.services.code_analysis import language_detector
 from src.services.code_analysis.language_detector import (
     UNKNOWN_LANGUAGE,
     LanguageInfo,
@@ -59,6 +60,13 @@ class TestLanguageInfo:
 
         assert info1 == info2
 
+    def test_from_lexer_shares_instance_per_lexer_class(self):
+        """Lexers of the same class should map to the same LanguageInfo."""
+        by_name = get_language_by_name("python")
+        by_content = detect_language_by_content("import os\nprint(os.sep)\n")
+
+        assert by_content is by_name
+
     def test_unknown_language_constant(self):
         """UNKNOWN_LANGUAGE should be properly defined."""
         assert UNKNOWN_LANGUAGE.name == "Plain Text"
@@ -120,6 +128,27 @@ class TestDetectLanguageByFilename:
         assert result is not None
         assert result.name in ["TypeScript", "TSX"]
 
+    def test_same_base_name_reuses_result(self):
+        """Should resolve a base name once, whatever its directory."""
+        first = detect_language_by_filename("src/main.py")
+        second = detect_language_by_filename("tests/main.py")
+
+        assert second is first
+
+    def test_same_extension_reuses_result(self):
+        """Should share one lookup between names with the same extension."""
+        first = detect_language_by_filename("main.py")
+        second = detect_language_by_filename("utils.py")
+
+        assert second is first
+
+    def test_whole_name_pattern_still_wins(self):
+        """Should honour Pygments patterns that match more than the extension."""
+        result = detect_language_by_filename("CMakeLists.txt")
+
+        assert result is not None
+        assert result.name == "CMake"
+
     def test_unknown_extension(self):
         """Should return None for unknown extensions."""
         result = detect_language_by_filename("file.xyz123")
@@ -220,6 +249,45 @@ print("Hello from Python!")
         assert result is not None
         assert result.name == "Python"
 
+    @pytest.mark.parametrize(
+        "shebang,expected",
+        [
+            ("#!/usr/bin/python3.11", "Python"),
+            ("#!/usr/bin/env -S node --no-warnings", "JavaScript"),
+            ("#!/bin/sh", "Bash"),
+            ("#!/usr/bin/env FOO=1 ruby", "Ruby"),
+            ("#!/usr/bin/perl6", "Perl6"),
+            ("#!/usr/bin/env perl6", "Perl6"),
+        ],
+    )
+    def test_shebang_interpreters(self, shebang, expected):
+        """Should resolve the interpreter named on the shebang line."""
+        result = detect_language_by_content(f"{shebang}\nx = 1\n")
+
+        assert result is not None
+        assert result.name == expected
+
+    def test_large_content(self):
+        """Should still detect the language of content far beyond the sample."""
+        code = "import os\n" + "x = os.getcwd()\n" * 10000
+
+        result = detect_language_by_content(code)
+
+        assert result is not None
+        assert result.name == "Python"
+
+    def test_repeated_content_reuses_guess(self, monkeypatch):
+        """Should not score the lexers again for content it has already seen."""
+        code = "import os\nprint(os.getpid())\n"
+        first = detect_language_by_content(code)
+
+        def fail(_text):
+            raise AssertionError("guess_lexer called again")
+
+        monkeypatch.setattr(language_detector, "guess_lexer", fail)
+
+        assert detect_language_by_content(code) is first
+
     def test_empty_content(self):
         """Should return None for empty content."""
         result = detect_language_by_content("")
@@ -268,6 +336,12 @@ def hello():
         assert result is not None
         # Should detect something (content-based detection is best-effort)
 
+    def test_extensionless_filename_used_as_content_hint(self):
+        """Names like Makefile should still steer content-based detection."""
+        result = detect_language(filename="Makefile", content="all:\n\techo hi\n")
+
+        assert result.name == "Makefile"
+
     def test_returns_unknown_when_both_fail(self):
         """Should return UNKNOWN_LANGUAGE when detection fails."""
         result = detect_language(filename="file.xyz", content="")
@@ -309,6 +383,14 @@ class TestGetSupportedLanguages:
 
         assert len(languages) > 100
 
+    def test_returned_list_can_be_modified(self):
+        """Changing a returned list should not affect later calls."""
+        languages = get_supported_languages()
+        count = len(languages)
+        languages.clear()
+
+        assert len(get_supported_languages()) == count
+
 
 class TestGetLanguageByName:
     """Tests for getting language by name."""
@@ -410,6 +492,11 @@ class TestGetExtensionForLanguage:
         assert js_ext is not None
         assert "js" in js_ext
 
+    def test_strips_glob_prefix(self):
+        """Should return the bare extension, not the Pygments pattern."""
+        assert get_extension_for_language("python") == ".py"
+        assert get_extension_for_language("javascript") == ".js"
+
     def test_unknown_language(self):
         """Should return None for unknown languages."""
         result = get_extension_for_language("nonexistent")
@@ -24,6 +24,7 @@ import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.learning_document import LearningDocument
 from src.models.project import Project
 from src.models.task import Task
 from src.models.user import User
@@ -379,6 +380,25 @@ class TestDocumentGenerationServiceRetry:
         assert document.generation_status == "failed"
         assert document.generation_error is not None
 
+    def test_retry_delay_is_capped_and_jittered(
+        self,
+        db_session: AsyncSession,
+        mock_gemini_client: MagicMock,
+    ) -> None:
+        """Backoff should stay within +/-50% of the capped exponential delay."""
+        service = DocumentGenerationService(
+            db=db_session,
+            gemini_client=mock_gemini_client,
+            config=GenerationConfig(base_delay=2.0, max_delay=30.0),
+        )
+
+        delays = [service._retry_delay(1, 3) for _ in range(50)]
+        capped = [service._retry_delay(5, 3) for _ in range(50)]
+
+        assert all(3.0 <= d <= 9.0 for d in delays)
+        assert all(15.0 <= d <= 45.0 for d in capped)
+        assert len(set(delays)) > 1
+
 
 class TestDocumentGenerationServiceValidation:
     """Test DocumentGenerationService content validation."""
@@ -494,6 +514,27 @@ class TestDocumentGenerationServiceStatus:
         assert status["status"] == "failed"
         assert "error" in status
 
+    @pytest.mark.asyncio
+    async def test_get_generation_status_in_progress(
+        self,
+        db_session: AsyncSession,
+        document_service: DocumentGenerationService,
+        task: Task,
+    ) -> None:
+        """Should report in-progress status with a time estimate."""
+        document = LearningDocument(
+            task_id=task.id,
+            content=DocumentGenerationService.PLACEHOLDER_CONTENT.copy(),
+        )
+        document.start_generation("celery-task-1")
+        db_session.add(document)
+        await db_session.commit()
+
+        status = await document_service.get_generation_status(task.id)
+        assert status["status"] == "in_progress"
+        assert status["completed_at"] is None
+        assert 0 <= status["estimated_time_remaining"] <= 180
+
 
 class TestDocumentGenerationServiceRetryFailed:
     """Test DocumentGenerationService retry_failed_document."""
@@ -591,6 +632,77 @@ class TestDocumentGenerationServiceDuplicate:
             )
 
 
+class TestDocumentGenerationServiceReuse:
+    """Test reuse of content generated from identical input."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_content_for_identical_code(
+        self,
+        db_session: AsyncSession,
+        document_service: DocumentGenerationService,
+        mock_gemini_client: MagicMock,
+        mock_gemini_response: GeminiResponse,
+        project: Project,
+        task: Task,
+    ) -> None:
+        """Should not call the AI again for code that only differs in line endings."""
+        mock_gemini_client.generate = AsyncMock(return_value=mock_gemini_response)
+        other_task = Task(
+            project_id=project.id,
+            title="Same Code Again",
+            task_number=2,
+            upload_method="paste",
+        )
+        db_session.add(other_task)
+        await db_session.commit()
+
+        await document_service.generate_document(
+            task_id=task.id,
+            code="def add(a, b):\n    return a + b\n",
+            language="Python",
+        )
+        document = await document_service.generate_document(
+            task_id=other_task.id,
+            code="def add(a, b):  \r\n    return a + b\r\n",
+            language="Python",
+        )
+
+        assert mock_gemini_client.generate.await_count == 1
+        assert document.is_completed
+        assert document.content == VALID_DOCUMENT_CONTENT
+
+    @pytest.mark.asyncio
+    async def test_generates_again_for_different_language(
+        self,
+        db_session: AsyncSession,
+        document_service: DocumentGenerationService,
+        mock_gemini_client: MagicMock,
+        mock_gemini_response: GeminiResponse,
+        project: Project,
+        task: Task,
+    ) -> None:
+        """Should treat the same code in another language as new input."""
+        mock_gemini_client.generate = AsyncMock(return_value=mock_gemini_response)
+        other_task = Task(
+            project_id=project.id,
+            title="Other Language",
+            task_number=2,
+            upload_method="paste",
+        )
+        db_session.add(other_task)
+        await db_session.commit()
+
+        code = "x = 1"
+        await document_service.generate_document(
+            task_id=task.id, code=code, language="Python"
+        )
+        await document_service.generate_document(
+            task_id=other_task.id, code=code, language="Ruby"
+        )
+
+        assert mock_gemini_client.generate.await_count == 2
+
+
 class TestDocumentGenerationServiceInputValidation:
     """Test DocumentGenerationService input validation."""
 
@@ -603,6 +715,15 @@ class TestDocumentGenerationServiceInputValidation:
         assert is_valid is False
         assert "empty" in error.lower()
 
+    def test_validate_code_input_whitespace_only(
+        self,
+        document_service: DocumentGenerationService,
+    ) -> None:
+        """Should reject code made only of whitespace."""
+        is_valid, error = document_service.validate_code_input(" \n\t\n")
+        assert is_valid is False
+        assert "empty" in error.lower()
+
     def test_validate_code_input_too_many_lines(
         self,
         document_service: DocumentGenerationService,
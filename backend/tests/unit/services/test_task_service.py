@@ -313,6 +313,36 @@ class TestTaskServiceGetByProject:
         tasks = await task_service.get_by_project(project.id)
         assert tasks == []
 
+    @pytest.mark.asyncio
+    async def test_get_by_project_rows_returns_ordered_rows(
+        self,
+        task_service: TaskService,
+        project: Project,
+    ) -> None:
+        """Should return active tasks as plain rows ordered by task_number."""
+        await task_service.create(
+            project_id=project.id,
+            title="First Task Title",
+            upload_method="file",
+        )
+        trashed = await task_service.create(
+            project_id=project.id,
+            title="Trashed Task Title",
+            upload_method="paste",
+        )
+        await task_service.create(
+            project_id=project.id,
+            title="Third Task Title",
+            upload_method="folder",
+        )
+        await task_service.soft_delete(trashed.id)
+
+        rows = await task_service.get_by_project_rows(project.id)
+
+        assert [row.task_number for row in rows] == [1, 3]
+        assert rows[1].title == "Third Task Title"
+        assert rows[1].upload_method == "folder"
+
 
 class TestTaskServiceUpdate:
     """Test TaskService.update method."""
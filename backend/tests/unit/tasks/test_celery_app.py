@@ -140,6 +140,34 @@ class TestGetCeleryConfig:
 
             assert config.worker_prefetch_multiplier == 4
 
+    def test_result_storage_defaults_without_env_vars(self):
+        """get_celery_config should store results for one hour by default."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = get_celery_config()
+
+            assert config.task_ignore_result is False
+            assert config.result_expires == 3600
+
+    def test_load_result_storage_from_env(self):
+        """get_celery_config should load result storage settings from environment."""
+        env = {"CELERY_TASK_IGNORE_RESULT": "true", "CELERY_RESULT_EXPIRES": "600"}
+
+        with patch.dict(os.environ, env, clear=True):
+            config = get_celery_config()
+
+            assert config.task_ignore_result is True
+            assert config.result_expires == 600
+
+    def test_invalid_result_expires_raises_error(self):
+        """get_celery_config should raise error for non-positive result expiry."""
+        env = {"CELERY_RESULT_EXPIRES": "0"}
+
+        with patch.dict(os.environ, env, clear=True):
+            with pytest.raises(CeleryConfigError) as exc_info:
+                get_celery_config()
+
+            assert "CELERY_RESULT_EXPIRES" in str(exc_info.value)
+
     def test_invalid_time_limit_raises_error(self):
         """get_celery_config should raise error for invalid time limit."""
         env = {"CELERY_TASK_TIME_LIMIT": "not-a-number"}
@@ -252,6 +280,30 @@ class TestCreateCeleryApp:
         assert app.conf.task_time_limit == 900
         assert app.conf.task_soft_time_limit == 800
 
+    def test_app_sets_result_storage_options(self):
+        """create_celery_app should apply result storage settings from config."""
+        app = create_celery_app(CeleryConfig())
+
+        assert app.conf.task_ignore_result is False
+        assert app.conf.result_expires == 3600
+
+        app = create_celery_app(CeleryConfig(task_ignore_result=True))
+
+        assert app.conf.task_ignore_result is True
+
+    def test_app_keeps_redis_connections_alive(self):
+        """create_celery_app should enable keepalive and health checks."""
+        config = CeleryConfig(redis_health_check_interval=15)
+        app = create_celery_app(config)
+
+        assert app.conf.broker_connection_retry_on_startup is True
+        assert app.conf.broker_transport_options == {
+            "socket_keepalive": True,
+            "health_check_interval": 15,
+        }
+        assert app.conf.redis_socket_keepalive is True
+        assert app.conf.redis_backend_health_check_interval == 15
+
     def test_create_without_config_uses_defaults(self):
         """create_celery_app without config should use environment defaults."""
         with patch.dict(os.environ, {}, clear=True):
@@ -279,6 +279,35 @@ class TestProjectServiceGetByUser:
         assert len(result) == 1
         assert result[0].title == "Active Project"
 
+    @pytest.mark.asyncio
+    async def test_get_projects_by_user_rows(self, db_session: AsyncSession):
+        """get_by_user_rows() should return active projects as plain rows."""
+        user = User(
+            email="project-rows@example.com",
+            password_hash="hash123",
+        )
+        db_session.add(user)
+        await db_session.commit()
+        await db_session.refresh(user)
+
+        active_project = Project(user_id=user.id, title="Active Project")
+        trashed_project = Project(user_id=user.id, title="Trashed Project")
+        db_session.add(active_project)
+        db_session.add(trashed_project)
+        await db_session.commit()
+
+        trashed_project.soft_delete()
+        await db_session.commit()
+
+        service = ProjectService(db_session)
+        rows = await service.get_by_user_rows(user.id)
+
+        assert len(rows) == 1
+        assert not isinstance(rows[0], Project)
+        assert rows[0].id == active_project.id
+        assert rows[0].title == "Active Project"
+        assert rows[0].deletion_status == "active"
+
     @pytest.mark.asyncio
     async def test_get_projects_by_user_isolates_users(self, db_session: AsyncSession):
         """get_by_user() should only return projects for specified user."""
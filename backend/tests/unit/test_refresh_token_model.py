@@ -39,7 +39,7 @@ class TestRefreshTokenCreation:
         expires_at = datetime.now(UTC) + timedelta(days=7)
         token = RefreshToken(
             user_id=user.id,
-            token_hash="sha256_hashed_token_value_here",
+            token_hash=b"sha256_hashed_token_value_here",
             expires_at=expires_at,
         )
         db_session.add(token)
@@ -48,7 +48,7 @@ class TestRefreshTokenCreation:
 
         assert token.id is not None
         assert token.user_id == user.id
-        assert token.token_hash == "sha256_hashed_token_value_here"
+        assert token.token_hash == b"sha256_hashed_token_value_here"
 
     @pytest.mark.asyncio
     async def test_refresh_token_id_is_uuid(self, db_session):
@@ -62,7 +62,7 @@ class TestRefreshTokenCreation:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="unique_hash_for_uuid_test",
+            token_hash=b"unique_hash_for_uuid_test",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token)
@@ -85,7 +85,7 @@ class TestRefreshTokenConstraints:
 
         token1 = RefreshToken(
             user_id=user.id,
-            token_hash="duplicate_hash_value",
+            token_hash=b"duplicate_hash_value",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token1)
@@ -93,7 +93,7 @@ class TestRefreshTokenConstraints:
 
         token2 = RefreshToken(
             user_id=user.id,
-            token_hash="duplicate_hash_value",  # Same hash
+            token_hash=b"duplicate_hash_value",  # Same hash
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token2)
@@ -106,7 +106,7 @@ class TestRefreshTokenConstraints:
         """RefreshToken without user_id should raise IntegrityError."""
         token = RefreshToken(
             user_id=None,  # type: ignore
-            token_hash="hash_no_user",
+            token_hash=b"hash_no_user",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token)
@@ -142,7 +142,7 @@ class TestRefreshTokenConstraints:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="hash_no_expires",
+            token_hash=b"hash_no_expires",
             expires_at=None,  # type: ignore
         )
         db_session.add(token)
@@ -164,7 +164,7 @@ class TestRefreshTokenDefaults:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="hash_default_revoked",
+            token_hash=b"hash_default_revoked",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token)
@@ -183,7 +183,7 @@ class TestRefreshTokenDefaults:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="hash_default_revoked_at",
+            token_hash=b"hash_default_revoked_at",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token)
@@ -203,7 +203,7 @@ class TestRefreshTokenDefaults:
         before = datetime.now(UTC)
         token = RefreshToken(
             user_id=user.id,
-            token_hash="hash_auto_created",
+            token_hash=b"hash_auto_created",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token)
@@ -232,7 +232,7 @@ class TestRefreshTokenRevocation:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="hash_to_revoke",
+            token_hash=b"hash_to_revoke",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token)
@@ -263,12 +263,12 @@ class TestRefreshTokenRelationships:
 
         token1 = RefreshToken(
             user_id=user.id,
-            token_hash="hash_token_1",
+            token_hash=b"hash_token_1",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         token2 = RefreshToken(
             user_id=user.id,
-            token_hash="hash_token_2",
+            token_hash=b"hash_token_2",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token1)
@@ -316,7 +316,7 @@ class TestRefreshTokenRepr:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="secret_hash_value",
+            token_hash=b"secret_hash_value",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token)
@@ -344,7 +344,7 @@ class TestRefreshTokenUtilityProperties:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="hash_not_expired",
+            token_hash=b"hash_not_expired",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token)
@@ -363,7 +363,7 @@ class TestRefreshTokenUtilityProperties:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="hash_expired",
+            token_hash=b"hash_expired",
             expires_at=datetime.now(UTC) - timedelta(seconds=1),  # Already expired
         )
         db_session.add(token)
@@ -382,7 +382,7 @@ class TestRefreshTokenUtilityProperties:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="hash_valid",
+            token_hash=b"hash_valid",
             expires_at=datetime.now(UTC) + timedelta(days=7),
         )
         db_session.add(token)
@@ -401,7 +401,7 @@ class TestRefreshTokenUtilityProperties:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="hash_revoked_check",
+            token_hash=b"hash_revoked_check",
             expires_at=datetime.now(UTC) + timedelta(days=7),
             revoked=True,
             revoked_at=datetime.now(UTC),
@@ -422,7 +422,7 @@ class TestRefreshTokenUtilityProperties:
 
         token = RefreshToken(
             user_id=user.id,
-            token_hash="hash_expired_check",
+            token_hash=b"hash_expired_check",
             expires_at=datetime.now(UTC) - timedelta(seconds=1),  # Expired
         )
         db_session.add(token)
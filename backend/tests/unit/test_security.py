@@ -268,3 +268,25 @@ class TestSecurityProperties:
         # Cost factor is in parts[2]
         cost = int(parts[2])
         assert 4 <= cost <= 31  # Valid bcrypt cost range
+
+
+class TestAsyncPasswordHelpers:
+    """Tests for the thread-pool backed async password helpers."""
+
+    async def test_hash_password_async_returns_bcrypt_hash(self):
+        """hash_password_async should return a verifiable bcrypt hash."""
+        from src.utils.security import hash_password_async, verify_password
+
+        result = await hash_password_async("async-password")
+
+        assert result.startswith("$2b$")
+        assert verify_password("async-password", result) is True
+
+    async def test_verify_password_async_matches_sync_result(self):
+        """verify_password_async should agree with verify_password."""
+        from src.utils.security import hash_password, verify_password_async
+
+        hashed = hash_password("async-password")
+
+        assert await verify_password_async("async-password", hashed) is True
+        assert await verify_password_async("wrong-password", hashed) is False
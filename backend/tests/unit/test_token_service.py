@@ -11,15 +11,21 @@ TDD RED Phase: These tests are written before the implementation.
 """
 
 import hashlib
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
+import jwt
 import pytest
 import pytest_asyncio
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.refresh_token import RefreshToken
 from src.models.user import User
+from src.services.auth import token_service as token_service_module
 from src.services.auth.token_service import TokenService
+from src.utils.jwt import ACCESS_TOKEN_EXPIRE_MINUTES
 from src.utils.security import hash_password
 
 
@@ -72,6 +78,18 @@ class TestCreateAccessToken:
         assert isinstance(token, str)
         assert len(token) > 0
 
+    @pytest.mark.asyncio
+    async def test_create_access_token_uses_int_timestamps(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """exp/iat should be integer NumericDates with the default lifetime."""
+        service = TokenService(db_session)
+        token = await service.create_access_token(test_user.id)
+        payload = jwt.decode(token, options={"verify_signature": False})
+        assert isinstance(payload["exp"], int)
+        assert isinstance(payload["iat"], int)
+        assert payload["exp"] - payload["iat"] == ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
 
 class TestCreateRefreshToken:
     """Tests for refresh token creation."""
@@ -108,7 +126,7 @@ class TestCreateRefreshToken:
         token = await service.create_refresh_token(test_user.id)
 
         # Calculate expected hash
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        token_hash = hashlib.sha256(token.encode()).digest()
 
         # Query database for the token
         from sqlalchemy import select
@@ -121,6 +139,20 @@ class TestCreateRefreshToken:
         assert db_token.user_id == test_user.id
         assert not db_token.revoked
 
+    @pytest.mark.asyncio
+    async def test_create_refresh_token_jti_is_row_id(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """Refresh token JTI should be the stored row's primary key."""
+        service = TokenService(db_session)
+        token = await service.create_refresh_token(test_user.id)
+
+        payload = jwt.decode(token, options={"verify_signature": False})
+        db_token = await db_session.get(RefreshToken, UUID(payload["jti"]))
+
+        assert db_token is not None
+        assert db_token.token_hash == hashlib.sha256(token.encode()).digest()
+
     @pytest.mark.asyncio
     async def test_create_multiple_refresh_tokens_unique(
         self, db_session: AsyncSession, test_user: User
@@ -188,6 +220,30 @@ class TestVerifyAccessToken:
         is_valid = await service.verify_access_token(token)
         assert is_valid is False
 
+    @pytest.mark.asyncio
+    async def test_verify_access_tokens_batch(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """Batch verification should return one result per token, in order."""
+        service = TokenService(db_session)
+        valid = await service.create_access_token(test_user.id)
+        expired = await service.create_access_token(
+            test_user.id, expires_delta=timedelta(seconds=-1)
+        )
+        refresh = await service.create_refresh_token(test_user.id)
+
+        results = await service.verify_access_tokens(
+            [valid, "invalid.token.here", expired, refresh, valid]
+        )
+
+        assert results == [True, False, False, False, True]
+
+    @pytest.mark.asyncio
+    async def test_verify_access_tokens_empty(self, db_session: AsyncSession) -> None:
+        """An empty batch should return an empty list."""
+        service = TokenService(db_session)
+        assert await service.verify_access_tokens([]) == []
+
 
 class TestVerifyRefreshToken:
     """Tests for refresh token verification."""
@@ -233,6 +289,43 @@ class TestVerifyRefreshToken:
         is_valid = await service.verify_refresh_token(token)
         assert is_valid is False
 
+    @pytest.mark.asyncio
+    async def test_verify_refresh_token_expired_in_database(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """A token whose stored expiry has passed should fail verification."""
+        service = TokenService(db_session)
+        token = await service.create_refresh_token(test_user.id)
+        await db_session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.token_hash == hashlib.sha256(token.encode()).digest())
+            .values(expires_at=datetime.now(UTC) - timedelta(minutes=1))
+        )
+        await db_session.commit()
+
+        assert await service.verify_refresh_token(token) is False
+
+    @pytest.mark.asyncio
+    async def test_verify_revoked_refresh_token_short_circuits(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """A JTI revoked by this process should be rejected without the DB."""
+        service = TokenService(db_session)
+        token = await service.create_refresh_token(test_user.id)
+        await service.revoke_refresh_token(token)
+
+        jti = jwt.decode(token, options={"verify_signature": False})["jti"]
+        assert jti in token_service_module._revoked_jtis
+
+        # Even if the database row were reinstated, the cache rejects replays
+        await db_session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.token_hash == hashlib.sha256(token.encode()).digest())
+            .values(revoked=False)
+        )
+        await db_session.commit()
+        assert await service.verify_refresh_token(token) is False
+
 
 class TestRotateRefreshToken:
     """Tests for refresh token rotation."""
@@ -294,6 +387,32 @@ class TestRotateRefreshToken:
         with pytest.raises(ValueError, match="Invalid or expired refresh token"):
             await service.rotate_refresh_token("invalid.token.here")
 
+    @pytest.mark.asyncio
+    async def test_rotate_refresh_token_twice_raises_error(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A token can be rotated only once, even without the JTI cache."""
+        service = TokenService(db_session)
+        old_token = await service.create_refresh_token(test_user.id)
+        await service.rotate_refresh_token(old_token)
+
+        monkeypatch.setattr(token_service_module, "_revoked_jtis", OrderedDict())
+        with pytest.raises(ValueError, match="Invalid or expired refresh token"):
+            await service.rotate_refresh_token(old_token)
+
+    @pytest.mark.asyncio
+    async def test_rotate_access_token_raises_error(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """Rotating an access token should raise ValueError."""
+        service = TokenService(db_session)
+        access_token = await service.create_access_token(test_user.id)
+        with pytest.raises(ValueError, match="Invalid or expired refresh token"):
+            await service.rotate_refresh_token(access_token)
+
 
 class TestRevokeRefreshToken:
     """Tests for single token revocation."""
@@ -385,6 +504,19 @@ class TestRevokeAllUserTokens:
         count = await service.revoke_all_user_tokens(test_user.id)
         assert count == 0
 
+    @pytest.mark.asyncio
+    async def test_revoke_all_user_tokens_skips_already_revoked(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """Already revoked tokens should not be counted again."""
+        service = TokenService(db_session)
+        token1 = await service.create_refresh_token(test_user.id)
+        await service.create_refresh_token(test_user.id)
+        await service.revoke_refresh_token(token1)
+
+        count = await service.revoke_all_user_tokens(test_user.id)
+        assert count == 1
+
 
 class TestCleanupExpiredTokens:
     """Tests for expired token cleanup."""
@@ -412,7 +544,7 @@ class TestCleanupExpiredTokens:
         # Create an expired token directly in DB
         expired_token = RefreshToken(
             user_id=test_user.id,
-            token_hash=hashlib.sha256(b"expired_token_1").hexdigest(),
+            token_hash=hashlib.sha256(b"expired_token_1").digest(),
             expires_at=datetime.now(UTC) - timedelta(days=1),
         )
         db_session.add(expired_token)
@@ -421,6 +553,37 @@ class TestCleanupExpiredTokens:
         count = await service.cleanup_expired_tokens()
         assert count >= 1
 
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_tokens_in_batches(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """Cleanup should delete every expired token across several batches."""
+        service = TokenService(db_session)
+        for i in range(5):
+            db_session.add(
+                RefreshToken(
+                    user_id=test_user.id,
+                    token_hash=hashlib.sha256(f"expired_batch_{i}".encode()).digest(),
+                    expires_at=datetime.now(UTC) - timedelta(days=1),
+                )
+            )
+        await db_session.commit()
+
+        count = await service.cleanup_expired_tokens(batch_size=2)
+        assert count == 5
+        assert await service.cleanup_expired_tokens(batch_size=2) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    async def test_cleanup_expired_tokens_rejects_invalid_batch_size(
+        self, db_session: AsyncSession, batch_size: int
+    ) -> None:
+        """Cleanup should reject batch sizes that could never finish."""
+        service = TokenService(db_session)
+
+        with pytest.raises(ValueError, match="batch_size"):
+            await service.cleanup_expired_tokens(batch_size=batch_size)
+
     @pytest.mark.asyncio
     async def test_cleanup_expired_tokens_keeps_valid(
         self, db_session: AsyncSession, test_user: User
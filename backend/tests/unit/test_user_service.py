@@ -28,7 +28,7 @@ import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.user import User
-from src.services.auth.user_service import UserService
+from src.services.auth.user_service import EmailAlreadyRegisteredError, UserService
 
 
 class TestUserServiceRegister:
@@ -88,6 +88,20 @@ class TestUserServiceRegister:
         with pytest.raises(ValueError, match="Email already registered"):
             await service.register(email=email, password="AnotherPass456!")
 
+    @pytest.mark.asyncio
+    async def test_register_duplicate_email_raises_specific_error(
+        self, db_session: AsyncSession
+    ):
+        """Duplicate emails should raise EmailAlreadyRegisteredError."""
+        # Arrange
+        service = UserService(db_session)
+        email = "duplicate-specific@example.com"
+        await service.register(email=email, password="SecurePass123!")
+
+        # Act & Assert
+        with pytest.raises(EmailAlreadyRegisteredError):
+            await service.register(email=email, password="AnotherPass456!")
+
     @pytest.mark.asyncio
     async def test_register_invalid_email_format_raises_error(
         self, db_session: AsyncSession